@@ -0,0 +1,47 @@
+"""Per invocation latency of boto3 clients with and without the client registry.
+
+A simulated invocation does what ``submit_video`` does before its first network call:
+it presigns the source object and prepares the SNS and MediaConvert clients.
+"""
+
+import boto3
+
+from benchmarks import fake_aws_environment, measure, report
+
+fake_aws_environment()
+
+from lambdas.src import clients
+
+ENDPOINT = "https://abcd1234.mediaconvert.eu-west-1.amazonaws.com"
+
+
+def invocation_without_registry():
+    """Create fresh clients like the handlers used to."""
+    s3 = boto3.client("s3")
+    s3.generate_presigned_url(
+        "get_object", Params={"Bucket": "bucket", "Key": "video.mp4"}, ExpiresIn=7200
+    )
+    boto3.client("sns")
+    boto3.client("mediaconvert", endpoint_url=ENDPOINT)
+
+
+def invocation_with_registry():
+    """Reuse clients from the registry."""
+    s3 = clients.get_client("s3")
+    s3.generate_presigned_url(
+        "get_object", Params={"Bucket": "bucket", "Key": "video.mp4"}, ExpiresIn=7200
+    )
+    clients.get_client("sns")
+    clients.get_client("mediaconvert", endpoint_url=ENDPOINT)
+
+
+def main(repeat: int = 200):
+    report(
+        "before: boto3.client per call", measure(invocation_without_registry, repeat)
+    )
+    report("after: client registry", measure(invocation_with_registry, repeat))
+    print(f"registry stats: {clients.registry.stats()}")
+
+
+if __name__ == "__main__":
+    main()
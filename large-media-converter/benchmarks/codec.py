@@ -0,0 +1,53 @@
+"""Decoding API events and encoding responses with the previous path versus the codec.
+
+Requests are decoded with ``ast.literal_eval`` before and strict JSON now; responses
+were serialized through the ``APIResponse`` model validator.
+"""
+
+import ast
+import base64
+import json
+
+from benchmarks import measure, report
+from lambdas.src.codec import decode_body, encode_response
+from lambdas.src.models import APIResponse
+
+
+def literal_decode(event: dict) -> dict:
+    body = event["body"]
+    if event.get("isBase64Encoded", False):
+        body = base64.b64decode(body).decode("utf-8")
+    return ast.literal_eval(body)
+
+
+def model_encode(body: dict) -> dict:
+    return APIResponse(body=body, headers={"Access-Control-Allow-Origin": "*"}).dict()
+
+
+def codec_encode(body: dict) -> dict:
+    return encode_response(body, headers={"Access-Control-Allow-Origin": "*"})
+
+
+def main():
+    bodies = {
+        "initialize": {"path": "user_id/video_id/my file.mov"},
+        "finalize 10k parts": {
+            "path": "user_id/video_id/my file.mov",
+            "file_id": "upload-id",
+            "parts": [{"PartNumber": n, "ETag": f"{n:032x}"} for n in range(1, 10001)],
+        },
+    }
+    for name, body in bodies.items():
+        encoded = base64.b64encode(json.dumps(body).encode("utf-8")).decode()
+        event = {"body": encoded, "isBase64Encoded": True}
+        repeat = 2000 if len(encoded) < 1000 else 20
+        assert literal_decode(event) == decode_body(event)
+
+        report(f"decode ast {name}", measure(lambda: literal_decode(event), repeat))
+        report(f"decode codec {name}", measure(lambda: decode_body(event), repeat))
+        report(f"encode model {name}", measure(lambda: model_encode(body), repeat))
+        report(f"encode codec {name}", measure(lambda: codec_encode(body), repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Validating finalize part lists with one model per part versus the compact part list.
+
+Both paths start from the decoded request body and end with the
+``complete_multipart_upload`` payload, for 1k and 10k parts in random order.
+"""
+
+import random
+import tracemalloc
+
+from pydantic import conlist, constr
+
+from benchmarks import measure, report
+from lambdas.src.finalize import Request
+from lambdas.src.models import APIRequest, BaseModelExtra
+
+
+class Part(BaseModelExtra):
+    """Part, as validated before the compact part list."""
+
+    PartNumber: int
+    ETag: str
+
+
+class ModelRequest(APIRequest):
+    """Finalize request with one model per part."""
+
+    path: constr(min_length=1, max_length=512)
+    file_id: constr(min_length=1, max_length=1024)
+    parts: conlist(Part, min_items=1)
+
+
+def model_payload(body: dict) -> list:
+    request = ModelRequest.parse_obj(body)
+    sorted_parts = sorted(request.parts, key=lambda x: x.PartNumber)
+    return [part.dict() for part in sorted_parts]
+
+
+def compact_payload(body: dict) -> list:
+    return Request.parse_obj(body).parts.to_boto3()
+
+
+def peak_memory(func, body: dict) -> float:
+    """Return the peak memory allocated by ``func`` in MiB."""
+    tracemalloc.start()
+    func(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024**2
+
+
+def main():
+    for parts, repeat in ((1000, 50), (10000, 10)):
+        body = {
+            "path": "user_id/video_id/my file.mov",
+            "file_id": "upload-id",
+            "parts": [
+                {"PartNumber": n, "ETag": f"{n:032x}"} for n in range(1, parts + 1)
+            ],
+        }
+        random.Random(0).shuffle(body["parts"])
+        assert model_payload(body) == compact_payload(body)
+
+        for name, func in (("model", model_payload), ("compact", compact_payload)):
+            report(f"{name} {parts} parts", measure(lambda: func(body), repeat))
+            print(f"{'':<40} peak={peak_memory(func, body):9.3f}MiB")
+
+
+if __name__ == "__main__":
+    main()
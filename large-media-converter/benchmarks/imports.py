@@ -0,0 +1,87 @@
+"""Import time profiler for the lambda handler modules.
+
+Every handler module is imported in a fresh interpreter with ``-X importtime``, which is
+what a cold start pays before the first event is handled. The report lists the total
+import time per handler and its most expensive dependencies.
+
+Usage: ``python -m benchmarks.imports [--top N] [--repeat N] [module ...]``
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_FOLDER = (Path(__file__).parent.parent / "lambdas" / "src").absolute()
+
+
+def handler_modules() -> list:
+    """Return the names of all modules in ``lambdas/src`` that define a handler."""
+    return sorted(
+        path.stem
+        for path in SRC_FOLDER.glob("*.py")
+        if "\ndef handler(" in path.read_text()
+    )
+
+
+def profile_module(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and parse the importtime output.
+
+    :return: Mapping of imported package to its cumulative import time in ms.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_FOLDER.as_posix())
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=SRC_FOLDER,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed: {result.stderr}")
+
+    # Children are printed before their parent, so direct dependencies are collected
+    # until the top level import they belong to shows up.
+    timings, children = {}, {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        duration = int(cumulative) / 1000
+        if depth == 1:
+            children[name.strip()] = duration
+        elif depth == 0:
+            if name.strip() == module:
+                timings.update(children)
+                timings[module] = duration
+            children = {}
+    return timings
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=handler_modules())
+    parser.add_argument("--top", type=int, default=5, help="dependencies to list")
+    parser.add_argument("--repeat", type=int, default=3, help="imports per module")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        runs = [profile_module(module) for _ in range(args.repeat)]
+        total = statistics.median(run.get(module, 0) for run in runs)
+        print(f"{module:<20} {total:9.1f}ms")
+
+        dependencies = {
+            name: statistics.median(run.get(name, 0) for run in runs)
+            for name in runs[0]
+            if name != module
+        }
+        heaviest = sorted(dependencies.items(), key=lambda item: -item[1])
+        for name, duration in heaviest[: args.top]:
+            print(f"    {name:<36} {duration:9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Presigning multipart upload part URLs with botocore versus the batch presigner.
+
+Also prints the ``/presign`` response size of the full URL list and of the compact
+template format, plain and gzip compressed.
+"""
+
+import boto3
+from botocore.config import Config
+
+from benchmarks import fake_aws_environment, measure, report
+
+fake_aws_environment()
+
+from lambdas.src.codec import encode_response
+from lambdas.src.presign_urls import (
+    Request,
+    make_compact_pre_signed_urls,
+    make_pre_signed_urls,
+)
+from lambdas.src.presigner import presign_upload_parts
+from lambdas.src.utils import gzip_api_response
+
+BUCKET = "dev-lmu-media-input-bucket"
+KEY = "user_id/video_id/my file.mov"
+UPLOAD_ID = "2~y2BVJqMRxCk0iKmW6QVjLfYqPbx5yd1VFc4t"
+
+
+def botocore_presign(s3, parts: int):
+    """Sign every part through generate_presigned_url."""
+    for part_number in range(1, parts + 1):
+        s3.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": BUCKET,
+                "Key": KEY,
+                "UploadId": UPLOAD_ID,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=3600,
+        )
+
+
+def batch_presign(s3, parts: int):
+    """Sign every part through the batch presigner."""
+    presign_upload_parts(s3, BUCKET, KEY, UPLOAD_ID, list(range(1, parts + 1)), 3600)
+
+
+def response_sizes(parts: int):
+    """Print the response body size of both formats in bytes."""
+    request = Request(path=KEY, file_id=UPLOAD_ID, parts=parts, format="compact")
+    part_numbers = list(range(1, parts + 1))
+    bodies = {
+        "urls": {"parts": make_pre_signed_urls(BUCKET, 3600, request, part_numbers)},
+        "compact": make_compact_pre_signed_urls(BUCKET, 3600, request, part_numbers),
+    }
+    for name, body in bodies.items():
+        response = encode_response(body)
+        compressed = gzip_api_response(response, {"Accept-Encoding": "gzip"})
+        print(
+            f"{name + ' ' + str(parts) + ' parts':<40} "
+            f"body={len(response['body']):>9}B "
+            f"gzip+base64={len(compressed['body']):>9}B"
+        )
+
+
+def main():
+    s3 = boto3.client(
+        "s3",
+        config=Config(signature_version="s3v4", s3={"use_accelerate_endpoint": True}),
+    )
+    for parts, repeat in ((1000, 10), (10000, 3)):
+        report(
+            f"botocore {parts} parts",
+            measure(lambda: botocore_presign(s3, parts), repeat),
+        )
+        report(
+            f"batch {parts} parts", measure(lambda: batch_presign(s3, parts), repeat)
+        )
+
+    for parts in (1000, 5000, 10000):
+        response_sizes(parts)
+
+
+if __name__ == "__main__":
+    main()
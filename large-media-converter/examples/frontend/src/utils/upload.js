@@ -5,6 +5,22 @@ const api = axios.create({
   baseURL: "/",
 })
 
+// expands a compact /presign response into { signedUrl, PartNumber } parts
+export function expandParts(data) {
+  if (data.format !== "compact") {
+    return data.parts
+  }
+  return data.signatures.map((signature, index) => {
+    const PartNumber = data.firstPart + index
+    return {
+      signedUrl: data.template
+        .replace("{PartNumber}", PartNumber)
+        .replace("{signature}", signature),
+      PartNumber: PartNumber,
+    }
+  })
+}
+
 // original source: https://github.com/pilovm/multithreaded-uploader/blob/master/frontend/uploader.js
 export class Uploader {
   constructor(options) {
@@ -17,6 +33,8 @@ export class Uploader {
     // number of parallel uploads
     options.threadsQuantity = options.threadsQuantity || 0
     this.threadsQuantity = Math.min(options.threadsQuantity || 5, 15)
+    // an explicit thread count caps the concurrency recommended by the upload plan
+    this.threadsLimited = Boolean(options.threadsQuantity)
     // adjust the timeout value to activate exponential backoff retry strategy 
     this.timeout = 0
     this.basePath = options.basePath || ""
@@ -30,6 +48,13 @@ export class Uploader {
     this.uploadedParts = []
     this.file_id = null
     this.path = null
+    // number of pre-signed urls fetched per /presign request
+    this.windowSize = options.windowSize || 500
+    this.numberOfParts = 0
+    this.nextPart = null
+    this.fetchingParts = false
+    // part numbers already uploaded before resuming
+    this.completedParts = new Set()
     this.onProgressFn = () => {}
     this.onErrorFn = () => {}
     this.baseURL = options.baseURL
@@ -59,12 +84,16 @@ export class Uploader {
         fileName = `${filePath}/${fileName}`
       }
 
-      // initializing the multipart request
+      // initializing the upload and retrieving the first window of pre-signed URLs
+      // in a single request, part size and count are planned from the file size
       const videoInitializationUploadInput = {
         path: fileName,
+        size: this.file.size,
+        max_parts: this.windowSize,
+        format: "compact",
       }
       const initializeReponse = await api.request({
-        url: "/initialize",
+        url: "/start",
         method: "POST",
         data: videoInitializationUploadInput,
         baseURL: this.baseURL,
@@ -75,18 +104,89 @@ export class Uploader {
 
       const AWSFileDataOutput = initializeReponse.data
 
-      this.file_id = AWSFileDataOutput.file_id
+      const plan = AWSFileDataOutput.plan
       this.path = AWSFileDataOutput.path
 
-      // retrieving the pre-signed URLs
-      const numberOfparts = Math.ceil(this.file.size / this.chunkSize)
+      if (!plan.multipart) {
+        // small files are uploaded with a single PUT, no parts and no finalize
+        await this.uploadSingle(AWSFileDataOutput.signedUrl)
+        return
+      }
 
-      const AWSMultipartFileDataInput = {
-        file_id: this.file_id,
-        path: this.path,
-        parts: numberOfparts,
+      this.file_id = AWSFileDataOutput.file_id
+      this.chunkSize = plan.part_size
+      this.threadsQuantity = this.threadsLimited
+        ? Math.min(plan.concurrency, this.threadsQuantity)
+        : plan.concurrency
+      this.numberOfParts = plan.parts
+      this.parts.push(...expandParts(AWSFileDataOutput).reverse())
+      this.nextPart = AWSFileDataOutput.nextPart
+
+      this.sendNext()
+    } catch (error) {
+      await this.complete(error)
+    }
+  }
+
+  // resumes an unfinished upload of the same file, uploading only the missing parts
+  async resume(file_id, path, partSize) {
+    try {
+      this.file_id = file_id
+      this.path = path
+      this.chunkSize = partSize
+      this.numberOfParts = Math.ceil(this.file.size / this.chunkSize)
+
+      const resumeResponse = await api.request({
+        url: "/resume",
+        method: "POST",
+        data: { file_id, path, parts: this.numberOfParts },
+        baseURL: this.baseURL,
+        headers: {
+          "authorization": this.authToken,
+        }
+      })
+
+      for (const part of resumeResponse.data.parts) {
+        this.completedParts.add(part.PartNumber)
+        this.uploadedParts.push({ PartNumber: part.PartNumber, ETag: part.ETag })
+        this.uploadedSize += part.Size
       }
 
+      this.nextPart = 1
+      await this.fetchParts()
+
+      this.sendNext()
+    } catch (error) {
+      await this.complete(error)
+    }
+  }
+
+  async uploadSingle(signedUrl) {
+    await axios.put(signedUrl, this.file, {
+      onUploadProgress: (event) => {
+        this.onProgressFn({
+          sent: event.loaded,
+          total: this.file.size,
+          percentage: Math.round((event.loaded / this.file.size) * 100),
+        })
+      },
+    })
+  }
+
+  async fetchParts() {
+    // urls are fetched in windows while uploading, so late parts do not expire
+    const AWSMultipartFileDataInput = {
+      file_id: this.file_id,
+      path: this.path,
+      parts: this.numberOfParts,
+      start_part: this.nextPart,
+      max_parts: this.windowSize,
+      // one url template plus a signature per part instead of a full url per part
+      format: "compact",
+    }
+
+    this.fetchingParts = true
+    try {
       const urlsResponse = await api.request({
         url: "/presign",
         method: "POST",
@@ -97,12 +197,20 @@ export class Uploader {
         }
       })
 
-      const newParts = urlsResponse.data.parts
-      this.parts.push(...newParts)
+      const newParts = expandParts(urlsResponse.data)
+        .filter((part) => !this.completedParts.has(part.PartNumber))
+      this.parts.unshift(...newParts.reverse())
+      this.nextPart = urlsResponse.data.nextPart
+    } finally {
+      this.fetchingParts = false
+    }
+  }
 
-      this.sendNext()
-    } catch (error) {
-      await this.complete(error)
+  prefetchParts() {
+    if (this.nextPart && !this.fetchingParts && this.parts.length < this.threadsQuantity * 2) {
+      this.fetchParts()
+        .then(() => this.sendNext())
+        .catch((error) => this.complete(error))
     }
   }
 
@@ -113,8 +221,10 @@ export class Uploader {
       return
     }
 
+    this.prefetchParts()
+
     if (!this.parts.length) {
-      if (!activeConnections) {
+      if (!activeConnections && !this.nextPart && !this.fetchingParts) {
         this.complete()
       }
 
@@ -172,13 +282,15 @@ export class Uploader {
 
   async sendCompleteRequest() {
     if (this.file_id && this.path) {
+      // large uploads are completed in the background to stay within the api timeout
       const videoFinalizationMultiPartInput = {
         file_id: this.file_id,
         path: this.path,
         parts: this.uploadedParts,
+        mode: this.uploadedParts.length > 1000 ? "async" : "sync",
       }
 
-      await api.request({
+      const finalizeResponse = await api.request({
         url: "/finalize",
         method: "POST",
         data: videoFinalizationMultiPartInput,
@@ -187,6 +299,34 @@ export class Uploader {
           "authorization": this.authToken,
         }
       })
+
+      if (finalizeResponse.status === 202) {
+        await this.waitForCompletion(finalizeResponse.data.token)
+      }
+    }
+  }
+
+  async waitForCompletion(token) {
+    const wait = (ms) => new Promise((res) => setTimeout(res, ms))
+
+    for (;;) {
+      const statusResponse = await api.request({
+        url: "/finalize/status",
+        method: "POST",
+        data: { token },
+        baseURL: this.baseURL,
+        headers: {
+          "authorization": this.authToken,
+        }
+      })
+
+      if (statusResponse.data.status === "completed") {
+        return
+      }
+      if (statusResponse.data.status === "failed") {
+        throw new Error(statusResponse.data.error)
+      }
+      await wait(1000)
     }
   }
 
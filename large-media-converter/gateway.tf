@@ -97,6 +97,66 @@ resource "aws_lambda_permission" "presign" {
   source_arn = "${aws_apigatewayv2_api.ingress-api.execution_arn}/*/*"
 }
 
+## Start upload
+
+resource "aws_apigatewayv2_integration" "start_upload" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  integration_uri    = aws_lambda_function.start_upload.invoke_arn
+  integration_type   = "AWS_PROXY"
+  integration_method = "POST"
+
+}
+
+resource "aws_apigatewayv2_route" "start_upload" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  route_key = "POST /start"
+  target    = "integrations/${aws_apigatewayv2_integration.start_upload.id}"
+
+  authorization_type = "CUSTOM"
+  authorizer_id      = aws_apigatewayv2_authorizer.auth.id
+}
+
+resource "aws_lambda_permission" "start_upload" {
+  statement_id  = "AllowExecutionFromAPIGateway"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.start_upload.function_name
+  principal     = "apigateway.amazonaws.com"
+
+  source_arn = "${aws_apigatewayv2_api.ingress-api.execution_arn}/*/*"
+}
+
+## Resume
+
+resource "aws_apigatewayv2_integration" "resume" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  integration_uri    = aws_lambda_function.resume.invoke_arn
+  integration_type   = "AWS_PROXY"
+  integration_method = "POST"
+
+}
+
+resource "aws_apigatewayv2_route" "resume" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  route_key = "POST /resume"
+  target    = "integrations/${aws_apigatewayv2_integration.resume.id}"
+
+  authorization_type = "CUSTOM"
+  authorizer_id      = aws_apigatewayv2_authorizer.auth.id
+}
+
+resource "aws_lambda_permission" "resume" {
+  statement_id  = "AllowExecutionFromAPIGateway"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.resume.function_name
+  principal     = "apigateway.amazonaws.com"
+
+  source_arn = "${aws_apigatewayv2_api.ingress-api.execution_arn}/*/*"
+}
+
 ## Finalize
 
 resource "aws_apigatewayv2_integration" "finalize" {
@@ -127,6 +187,36 @@ resource "aws_lambda_permission" "finalize" {
   source_arn = "${aws_apigatewayv2_api.ingress-api.execution_arn}/*/*"
 }
 
+## Finalize status
+
+resource "aws_apigatewayv2_integration" "finalize_status" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  integration_uri    = aws_lambda_function.finalize_status.invoke_arn
+  integration_type   = "AWS_PROXY"
+  integration_method = "POST"
+
+}
+
+resource "aws_apigatewayv2_route" "finalize_status" {
+  api_id = aws_apigatewayv2_api.ingress-api.id
+
+  route_key = "POST /finalize/status"
+  target    = "integrations/${aws_apigatewayv2_integration.finalize_status.id}"
+
+  authorization_type = "CUSTOM"
+  authorizer_id      = aws_apigatewayv2_authorizer.auth.id
+}
+
+resource "aws_lambda_permission" "finalize_status" {
+  statement_id  = "AllowExecutionFromAPIGateway"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.finalize_status.function_name
+  principal     = "apigateway.amazonaws.com"
+
+  source_arn = "${aws_apigatewayv2_api.ingress-api.execution_arn}/*/*"
+}
+
 # Auth
 
 resource "aws_apigatewayv2_authorizer" "auth" {
@@ -48,6 +48,13 @@ resource "aws_iam_policy" "iam_policy_for_lambda" {
         Resource = "arn:aws:s3:::*",
         Effect   = "Allow",
       },
+      {
+        Action = [
+          "lambda:InvokeFunction",
+        ],
+        Resource = "arn:aws:lambda:*:*:function:${local.name}-finalize_worker",
+        Effect   = "Allow",
+      },
       {
         Action   = "mediaconvert:CreateJob",
         Effect   = "Allow",
@@ -38,6 +38,7 @@ resource "aws_lambda_function" "video_submit_lambda" {
       INPUT_FILE_SUFFIXES = jsonencode(var.video_file_suffixes)
       MAX_WIDTH           = var.video_max_width
       MAX_HEIGHT          = var.video_max_height
+      RECORD_CONCURRENCY  = var.record_concurrency
     }
   }
 }
@@ -82,6 +83,7 @@ resource "aws_lambda_function" "process_image" {
       DESTINATION_BUCKET  = local.output_bucket
       SNS_TOPIC_ARN       = aws_sns_topic.large-media-upload-updates.arn
       INPUT_FILE_SUFFIXES = jsonencode(var.image_file_suffixes)
+      RECORD_CONCURRENCY  = var.record_concurrency
     }
   }
 }
@@ -125,6 +127,7 @@ resource "aws_lambda_function" "process_audio" {
       DESTINATION_BUCKET  = local.output_bucket
       SNS_TOPIC_ARN       = aws_sns_topic.large-media-upload-updates.arn
       INPUT_FILE_SUFFIXES = jsonencode(var.audio_file_suffixes)
+      RECORD_CONCURRENCY  = var.record_concurrency
     }
   }
 }
@@ -265,6 +268,65 @@ resource "aws_lambda_function" "presigned_urls" {
   }
 }
 
+## start_upload Lambda
+
+resource "aws_lambda_function" "start_upload" {
+  function_name = "${local.name}-start_upload"
+  role          = aws_iam_role.lambda_role.arn
+
+  image_uri    = "${aws_ecr_repository.lambda_repository.repository_url}:${local.image_tag}"
+  package_type = "Image"
+  timeout      = 10
+
+  image_config {
+    command = ["start_upload.handler"]
+  }
+
+  depends_on = [
+    aws_iam_role_policy_attachment.iam_policy_for_job_complete_role,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_lambda,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_mediaconvert,
+    resource.null_resource.build_push_dkr_img,
+  ]
+
+  environment {
+    variables = {
+      BUCKET_NAME         = aws_s3_bucket.media-input-bucket.bucket
+      INPUT_FILE_SUFFIXES = jsonencode(local.all_suffixes)
+      URL_EXPIRES         = 3600
+    }
+  }
+}
+
+## resume Lambda
+
+resource "aws_lambda_function" "resume" {
+  function_name = "${local.name}-resume"
+  role          = aws_iam_role.lambda_role.arn
+
+  image_uri    = "${aws_ecr_repository.lambda_repository.repository_url}:${local.image_tag}"
+  package_type = "Image"
+  timeout      = 10
+
+  image_config {
+    command = ["resume.handler"]
+  }
+
+  depends_on = [
+    aws_iam_role_policy_attachment.iam_policy_for_job_complete_role,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_lambda,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_mediaconvert,
+    resource.null_resource.build_push_dkr_img,
+  ]
+
+  environment {
+    variables = {
+      BUCKET_NAME         = aws_s3_bucket.media-input-bucket.bucket
+      INPUT_FILE_SUFFIXES = jsonencode(local.all_suffixes)
+    }
+  }
+}
+
 # finalize Lambda
 
 resource "aws_lambda_function" "finalize" {
@@ -288,8 +350,70 @@ resource "aws_lambda_function" "finalize" {
 
   environment {
     variables = {
-      BUCKET_NAME         = aws_s3_bucket.media-input-bucket.bucket
-      INPUT_FILE_SUFFIXES = jsonencode(local.all_suffixes)
+      BUCKET_NAME              = aws_s3_bucket.media-input-bucket.bucket
+      INPUT_FILE_SUFFIXES      = jsonencode(local.all_suffixes)
+      FINALIZE_BUCKET_NAME     = aws_s3_bucket.media-config-bucket.bucket
+      FINALIZE_WORKER_FUNCTION = aws_lambda_function.finalize_worker.function_name
+    }
+  }
+}
+
+## finalize worker Lambda, completes uploads of asynchronous finalize requests
+
+resource "aws_lambda_function" "finalize_worker" {
+  function_name = "${local.name}-finalize_worker"
+  role          = aws_iam_role.lambda_role.arn
+
+  image_uri    = "${aws_ecr_repository.lambda_repository.repository_url}:${local.image_tag}"
+  package_type = "Image"
+  timeout      = 300
+
+  image_config {
+    command = ["finalize.worker"]
+  }
+
+  depends_on = [
+    aws_iam_role_policy_attachment.iam_policy_for_job_complete_role,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_lambda,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_mediaconvert,
+    resource.null_resource.build_push_dkr_img,
+  ]
+
+  environment {
+    variables = {
+      BUCKET_NAME          = aws_s3_bucket.media-input-bucket.bucket
+      INPUT_FILE_SUFFIXES  = jsonencode(local.all_suffixes)
+      FINALIZE_BUCKET_NAME = aws_s3_bucket.media-config-bucket.bucket
+    }
+  }
+}
+
+## finalize status Lambda
+
+resource "aws_lambda_function" "finalize_status" {
+  function_name = "${local.name}-finalize_status"
+  role          = aws_iam_role.lambda_role.arn
+
+  image_uri    = "${aws_ecr_repository.lambda_repository.repository_url}:${local.image_tag}"
+  package_type = "Image"
+  timeout      = 10
+
+  image_config {
+    command = ["finalize.status"]
+  }
+
+  depends_on = [
+    aws_iam_role_policy_attachment.iam_policy_for_job_complete_role,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_lambda,
+    aws_iam_role_policy_attachment.attach_iam_policy_to_iam_role_mediaconvert,
+    resource.null_resource.build_push_dkr_img,
+  ]
+
+  environment {
+    variables = {
+      BUCKET_NAME          = aws_s3_bucket.media-input-bucket.bucket
+      INPUT_FILE_SUFFIXES  = jsonencode(local.all_suffixes)
+      FINALIZE_BUCKET_NAME = aws_s3_bucket.media-config-bucket.bucket
     }
   }
 }
@@ -6,11 +6,14 @@ from pathlib import Path
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import log
 from errors import UnsupportedPayloadException
 from models import APIResponse, BaseModelExtra
 from models import Settings as BaseSettings
 from pydantic import ValidationError
 
+logger = log.get_logger(__name__)
+
 
 class LambdaSettings(BaseSettings):
     """Lambda Settings."""
@@ -27,7 +30,7 @@ class Request(BaseModelExtra):
 
 def handler(event, context):
     """Lambda handler function initialize multipart upload."""
-    print(event)
+    log.payload(logger, "Request", event)
     lst = LambdaSettings()
     try:
         event = Request.parse_obj(event)
@@ -35,7 +38,7 @@ def handler(event, context):
         UnsupportedPayloadException,
         ValidationError,
     ) as err:
-        print(f"Payload validation error: {err}")
+        logger.warning("Payload validation error: %s", err)
         return APIResponse(statusCode=400, body=str(err)).dict()
 
     headers = {k.lower(): v for k, v in event.headers.items()}
@@ -0,0 +1,157 @@
+"""Processing of every record of batched S3, SNS and SQS notifications.
+
+S3 and SNS deliver several records per invocation, SQS a batch of messages. Each record
+is split into a single object S3 event and processed on a bounded thread pool, so one
+warm invocation can drain a whole batch. Failures are collected per record instead of
+dropping the rest of the batch.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import log
+import utils
+from errors import BatchRecordException
+
+logger = log.get_logger(__name__)
+
+
+def s3_events(event: dict) -> List[dict]:
+    """Split an SNS or S3 notification into one S3 event per object.
+
+    SNS records wrap a whole S3 notification in their message, which may hold several
+    objects itself.
+    """
+    events = []
+    for record in event.get("Records", []):
+        if "Sns" in record:
+            s3_event = utils.convert_sns_event_to_s3_event({"Records": [record]})
+        else:
+            s3_event = {"Records": [record]}
+        events.extend({"Records": [item]} for item in s3_event.get("Records", []))
+    return events
+
+
+def is_sqs_event(event: dict) -> bool:
+    """Check if the event is a batch of SQS messages."""
+    records = event.get("Records") or [{}]
+    return records[0].get("eventSource") == "aws:sqs"
+
+
+def sqs_s3_events(record: dict) -> List[dict]:
+    """Split an SQS message into one S3 event per object.
+
+    The message body is an S3 notification, wrapped in an SNS envelope unless the
+    subscription uses raw message delivery.
+    """
+    body = json.loads(record["body"])
+    if body.get("Type") == "Notification":
+        body = json.loads(body["Message"])
+    return [{"Records": [item]} for item in body.get("Records", [])]
+
+
+def record_key(event: dict) -> str:
+    """Return the object key of a single object S3 event for logging."""
+    try:
+        return event["Records"][0]["s3"]["object"]["key"]
+    except (KeyError, IndexError, TypeError):
+        return "unknown"
+
+
+def process_records(
+    events: List[dict], func: Callable[[dict], None], max_workers: int
+) -> List[Tuple[dict, Exception]]:
+    """Call ``func`` for every event, on a thread pool of at most ``max_workers``.
+
+    A single event is processed on the calling thread.
+
+    :return: The failed events with their exception, in order of ``events``.
+    """
+
+    def run(event: dict):
+        try:
+            func(event)
+        except Exception as err:
+            logger.exception("Processing %s failed", record_key(event))
+            return event, err
+        return None
+
+    if len(events) <= 1 or max_workers <= 1:
+        results = [run(event) for event in events]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(events))) as pool:
+            results = list(pool.map(run, events))
+    return [result for result in results if result is not None]
+
+
+def process_sqs_messages(
+    event: dict, func: Callable[[dict], None], max_workers: int
+) -> dict:
+    """Call ``func`` for every object of a batch of SQS messages.
+
+    :return: The partial batch response; a message is reported as failed if any of its
+        objects failed, so only failed messages are retried.
+    """
+    failed, events, messages = [], [], {}
+    for record in event["Records"]:
+        try:
+            s3_events = sqs_s3_events(record)
+        except (KeyError, TypeError, ValueError):
+            logger.exception("Unreadable message %s", record.get("messageId"))
+            failed.append(record["messageId"])
+            continue
+        for s3_event in s3_events:
+            messages[id(s3_event)] = record["messageId"]
+            events.append(s3_event)
+
+    failures = process_records(events, func, max_workers)
+    failed.extend(messages[id(s3_event)] for s3_event, _ in failures)
+
+    logger.info(
+        "Processed %d messages, %d failed", len(event["Records"]), len(set(failed))
+    )
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in dict.fromkeys(failed)
+        ]
+    }
+
+
+def handle_event(
+    event: dict, func: Callable[[dict], None], max_workers: int
+) -> Optional[dict]:
+    """Process every object of an SNS, S3 or SQS event.
+
+    :return: The partial batch response for SQS events.
+    :raises: The error of a failed record for SNS and S3 events.
+    """
+    if is_sqs_event(event):
+        return process_sqs_messages(event, func, max_workers)
+
+    events = s3_events(event)
+    failures = process_records(events, func, max_workers)
+    raise_on_failures(failures, len(events))
+    return None
+
+
+def raise_on_failures(failures: List[Tuple[dict, Exception]], total: int):
+    """Raise if any record failed, so the invocation is reported as failed.
+
+    A single failure is raised as is, several failures as one exception listing the
+    keys of every failed record.
+    """
+    if not failures:
+        return
+    if len(failures) == 1:
+        raise failures[0][1]
+
+    keys = ", ".join(record_key(event) for event, _ in failures)
+    raise BatchRecordException(
+        f"{len(failures)} of {total} records failed: {keys}"
+    ) from failures[0][1]
@@ -0,0 +1,108 @@
+"""Lazy bootstrap shared by all lambda handlers.
+
+Heavy dependencies (sentry, boto3, tenacity, PIL) are imported on first use instead of
+at module import, so a cold start only pays for what the invocation actually touches.
+"""
+
+import functools
+import sys
+from pathlib import Path
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+from models import Settings
+
+_sentry_initialized = False
+
+
+@functools.lru_cache(maxsize=None)
+def settings() -> Settings:
+    """Return the global settings, parsed once per container."""
+    return Settings()
+
+
+def init_sentry() -> bool:
+    """Initialize Sentry once per container.
+
+    Sentry is skipped entirely when no DSN is configured.
+
+    :return: True if Sentry was initialized by this call.
+    """
+    global _sentry_initialized
+
+    if _sentry_initialized:
+        return False
+    _sentry_initialized = True
+
+    config = settings()
+    if not config.sentry_dsn:
+        return False
+
+    import sentry_sdk
+    from sentry_sdk.integrations.aws_lambda import AwsLambdaIntegration
+    from sentry_sdk.integrations.logging import LoggingIntegration
+
+    # Errors reach Sentry as exceptions, log records are only kept as breadcrumbs
+    sentry_sdk.init(
+        dsn=config.sentry_dsn,
+        integrations=[
+            AwsLambdaIntegration(),
+            LoggingIntegration(event_level=None),
+        ],
+        traces_sample_rate=config.sentry_traces_sample_rate,
+        environment=config.environment,
+    )
+    return True
+
+
+def lambda_handler(func):
+    """Decorate a lambda handler to set up Sentry on its first invocation.
+
+    The AWS Lambda integration only wraps invocations that start after Sentry was
+    initialized, so errors of the invocation that initializes it are reported here.
+    The request id of the invocation is added to every log record.
+    """
+
+    @functools.wraps(func)
+    def wrapper(event, context):
+        import log
+
+        log.bind(request_id=getattr(context, "aws_request_id", None))
+        first_invocation = init_sentry()
+        try:
+            return func(event, context)
+        except Exception:
+            if first_invocation:
+                import sentry_sdk
+
+                sentry_sdk.capture_exception()
+                sentry_sdk.flush()
+            raise
+
+    return wrapper
+
+
+def retry_on(exception: type, attempts: int = 5, wait: float = 3):
+    """Retry decorator that builds its tenacity policy on the first call."""
+
+    def decorator(func):
+        retrying = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal retrying
+            if retrying is None:
+                import tenacity
+
+                retrying = tenacity.retry(
+                    stop=tenacity.stop_after_attempt(attempts),
+                    wait=tenacity.wait_fixed(wait),
+                    retry=tenacity.retry_if_exception_type(exception),
+                    reraise=True,
+                )(func)
+            return retrying(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,130 @@
+"""Registry of boto3 clients shared across warm lambda invocations."""
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import bootstrap
+
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+
+class ClientRegistry:
+    """Caches boto3 clients keyed by service, region, endpoint and config.
+
+    Creating a client resolves credentials, loads the service model and opens a fresh
+    connection pool. Lambda keeps the module alive between warm invocations, so a client
+    built once can serve every following invocation of the container.
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: Optional[int] = None,
+        tcp_keepalive: Optional[bool] = None,
+    ):
+        self.max_pool_connections = max_pool_connections
+        self.tcp_keepalive = tcp_keepalive
+        self.hits = 0
+        self.misses = 0
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _base_config(self) -> "Config":
+        """Connection settings applied to every client of the registry."""
+        from botocore.config import Config
+
+        if self.max_pool_connections is None or self.tcp_keepalive is None:
+            settings = bootstrap.settings()
+            if self.max_pool_connections is None:
+                self.max_pool_connections = settings.boto_max_pool_connections
+            if self.tcp_keepalive is None:
+                self.tcp_keepalive = settings.boto_tcp_keepalive
+        return Config(
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=self.tcp_keepalive,
+        )
+
+    @staticmethod
+    def _key(
+        service: str,
+        region_name: Optional[str],
+        endpoint_url: Optional[str],
+        config: Optional["Config"],
+    ) -> tuple:
+        """Build the hashable cache key of a client."""
+        region = (
+            region_name
+            or os.environ.get("AWS_REGION")
+            or os.environ.get("AWS_DEFAULT_REGION")
+        )
+        options = ()
+        if config is not None:
+            options = tuple(
+                sorted(
+                    (name, repr(value))
+                    for name, value in config._user_provided_options.items()
+                )
+            )
+        return service, region, endpoint_url, options
+
+    def client(
+        self,
+        service: str,
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        config: Optional["Config"] = None,
+    ):
+        """Return a cached client, creating it on the first request."""
+        key = self._key(service, region_name, endpoint_url, config)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.hits += 1
+                return client
+
+            self.misses += 1
+            import boto3
+
+            merged = self._base_config()
+            if config is not None:
+                merged = merged.merge(config)
+            client = boto3.client(
+                service,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=merged,
+            )
+            self._clients[key] = client
+            return client
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters of the registry."""
+        return {"hits": self.hits, "misses": self.misses, "clients": len(self._clients)}
+
+    def clear(self):
+        """Drop all cached clients and reset the counters."""
+        with self._lock:
+            self._clients.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+registry = ClientRegistry()
+
+
+def get_client(
+    service: str,
+    region_name: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+    config: Optional["Config"] = None,
+):
+    """Return a boto3 client from the module level registry."""
+    return registry.client(
+        service, region_name=region_name, endpoint_url=endpoint_url, config=config
+    )
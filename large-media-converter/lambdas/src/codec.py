@@ -0,0 +1,101 @@
+"""JSON codec for API Gateway proxy events and responses."""
+
+import ast
+import base64
+import binascii
+import json
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import bootstrap
+from errors import (
+    NoEventBodyException,
+    PayloadTooLargeException,
+    UnsupportedPayloadException,
+)
+
+
+def _reject_constant(name: str):
+    """Reject the NaN and Infinity extensions of the json module."""
+    raise UnsupportedPayloadException(f"Invalid JSON constant: {name}")
+
+
+_decoder = json.JSONDecoder(parse_constant=_reject_constant)
+_encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
+
+def decode_body(event: dict, max_bytes: Optional[int] = None) -> dict:
+    """Decode the JSON object in the body of an API Gateway proxy event.
+
+    :param max_bytes: Maximum size of the decoded body, defaults to the
+        ``API_MAX_BODY_BYTES`` setting.
+    :raises UnsupportedPayloadException: If the body is missing, too large or not a
+        JSON object.
+    """
+    settings = bootstrap.settings()
+    if max_bytes is None:
+        max_bytes = settings.api_max_body_bytes
+
+    body = event.get("body")
+    if body is None:
+        raise NoEventBodyException("event.body is not defined")
+    if isinstance(body, dict):
+        return body
+
+    if event.get("isBase64Encoded", False):
+        if len(body) > (max_bytes + 2) // 3 * 4:
+            raise PayloadTooLargeException(f"Body exceeds {max_bytes} bytes")
+        try:
+            body = base64.b64decode(body, validate=True)
+        except (binascii.Error, ValueError) as err:
+            raise UnsupportedPayloadException(f"Invalid base64 body: {err}")
+    if len(body) > max_bytes:
+        raise PayloadTooLargeException(f"Body exceeds {max_bytes} bytes")
+
+    if isinstance(body, bytes):
+        try:
+            body = body.decode("utf-8")
+        except UnicodeDecodeError as err:
+            raise UnsupportedPayloadException(f"Body is not UTF-8: {err}")
+
+    try:
+        value = _decoder.decode(body)
+    except json.JSONDecodeError as err:
+        if not settings.api_literal_bodies:
+            raise UnsupportedPayloadException(f"Body is not valid JSON: {err}")
+        value = _decode_literal(body)
+
+    if not isinstance(value, dict):
+        raise UnsupportedPayloadException("Body must be a JSON object")
+    return value
+
+
+def _decode_literal(body: str):
+    """Decode a Python literal body, as sent by legacy clients."""
+    try:
+        return ast.literal_eval(body)
+    except (ValueError, SyntaxError, MemoryError, RecursionError) as err:
+        raise UnsupportedPayloadException(f"Body is not valid JSON: {err}")
+
+
+def encode_response(
+    body: Union[str, dict, list],
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> dict:
+    """Serialize a body straight into the Lambda proxy response shape.
+
+    Strings are wrapped as ``{"message": body}``, like :class:`models.APIResponse`.
+    """
+    if isinstance(body, str):
+        body = {"message": body}
+    return {
+        "statusCode": status_code,
+        "body": _encoder.encode(body),
+        "headers": headers or {},
+        "isBase64Encoded": False,
+    }
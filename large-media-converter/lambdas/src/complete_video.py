@@ -2,18 +2,19 @@ import os
 import sys
 from pathlib import Path
 
-import boto3
-from botocore.exceptions import ClientError
-from PIL import Image
-
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import bootstrap
+import clients
+import log
 import utils
 from errors import ElementalConvertException
 from models import JobStatus
 from models import Settings as BaseSettings
 
+logger = log.get_logger(__name__)
+
 
 class LambdaSettings(BaseSettings):
     """Lambda Settings."""
@@ -24,6 +25,8 @@ class LambdaSettings(BaseSettings):
 
 def create_thumbnail_and_upload_to_s3(s3_url: str):
     """Create a thumbnail and upload to S3."""
+    from PIL import Image
+
     bucket, key = utils.s3_url_to_bucket_and_key(s3_url)
     conv_thumb_key = Path(key).with_suffix(
         ".0000000.jpg"
@@ -31,7 +34,7 @@ def create_thumbnail_and_upload_to_s3(s3_url: str):
     final_thum_key = Path(key).with_suffix(".png")
 
     # download jpg from elemental
-    s3 = boto3.client("s3")
+    s3 = clients.get_client("s3")
     s3.download_file(bucket, conv_thumb_key.as_posix(), "/tmp/thumbnail.jpg")
 
     # convert jpg to png
@@ -46,12 +49,14 @@ def create_thumbnail_and_upload_to_s3(s3_url: str):
             "Metadata": {"Content-Type": "image/png"},
         },
     )
-    print(f"Thumbnail uploaded to s3://{bucket}/{final_thum_key}")
+    logger.info("Thumbnail uploaded to s3://%s/%s", bucket, final_thum_key)
 
 
 def summarize_job_details(endpoint, data):
+    from botocore.exceptions import ClientError
+
     try:
-        mediaconvert_client = boto3.client("mediaconvert", endpoint_url=endpoint)
+        mediaconvert_client = clients.get_client("mediaconvert", endpoint_url=endpoint)
         job_data = mediaconvert_client.get_job(Id=data["detail"]["jobId"])
         input_file = job_data["Job"]["Settings"]["Inputs"][0]["FileInput"]
         path_elements = input_file.replace("s3://", "").split("/")
@@ -76,6 +81,8 @@ def summarize_job_details(endpoint, data):
 
 
 def send_sns(topic, status, data):
+    from botocore.exceptions import ClientError
+
     try:
         msg = JobStatus(
             id=data["Id"],
@@ -90,10 +97,11 @@ def send_sns(topic, status, data):
         raise Exception(f"Error sending SNS notification: {error}")
 
 
+@bootstrap.lambda_handler
 def handler(event, context):
     """Lambda handler triggered by MediaConvert job status updates."""
 
-    print(f"REQUEST:: {event}")
+    log.payload(logger, "Request", event)
     lst = LambdaSettings()
     job_details = summarize_job_details(lst.mediaconvert_endpoint, event)
     _, src_file = utils.s3_url_to_bucket_and_key(job_details["InputFile"])
@@ -102,7 +110,7 @@ def handler(event, context):
     try:
         status = event["detail"]["status"]
         if status in ["INPUT_INFORMATION", "PROGRESSING"]:
-            print(f"Ignoring status: {status}")
+            logger.info("Ignoring status: %s", status)
             return
         elif status == "COMPLETE":
             if job_details["OutputFile"] == "":
@@ -10,6 +10,10 @@ class NoEventBodyException(UnsupportedPayloadException):
     """Raised when event.body is not defined."""
 
 
+class PayloadTooLargeException(UnsupportedPayloadException):
+    """Raised when event.body exceeds the size limit."""
+
+
 class UnsupportedTypeException(LambdaException):
     """Raised when the media type is not supported."""
 
@@ -36,3 +40,7 @@ class MediaInfoException(LambdaException):
 
 class ElementalConvertException(LambdaException):
     """Raised when Elemental MediaConvert fails to process the video."""
+
+
+class BatchRecordException(LambdaException):
+    """Raised when records of a batched event failed to process."""
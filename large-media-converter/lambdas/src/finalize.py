@@ -1,18 +1,25 @@
+import hashlib
+import json
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional
 
-import boto3
-from botocore.exceptions import ClientError
-from pydantic import ValidationError, conlist, constr
+from pydantic import ValidationError, constr
 
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import bootstrap
+import clients
+import codec
+import log
 import utils
 from errors import UnsupportedPayloadException, UnsupportedTypeException
-from models import APIRequest, APIResponse, BaseModelExtra
+from models import APIRequest
 from models import Settings as BaseSettings
+from partlist import PartList
+
+logger = log.get_logger(__name__)
 
 
 class LambdaSettings(BaseSettings):
@@ -20,13 +27,9 @@ class LambdaSettings(BaseSettings):
 
     bucket_name: str
     input_file_suffixes: List[str]
-
-
-class Part(BaseModelExtra):
-    """Part."""
-
-    PartNumber: int
-    ETag: str
+    finalize_bucket_name: str = ""
+    finalize_prefix: str = "finalize/"
+    finalize_worker_function: str = ""
 
 
 class Request(APIRequest):
@@ -34,44 +37,208 @@ class Request(APIRequest):
 
     path: constr(min_length=1, max_length=512)
     file_id: constr(min_length=1, max_length=1024)
-    parts: conlist(Part, min_items=1)
+    parts: PartList
+    mode: Literal["sync", "async"] = "sync"
+
+
+class StatusRequest(APIRequest):
+    """API Request."""
+
+    token: constr(regex=r"^[0-9a-f]{32}$")
+
+
+def complete_upload(bucket_name: str, path: str, file_id: str, parts: List[dict]):
+    """Complete a multipart upload with the parts in part number order."""
+    multipart_params = {
+        "Bucket": bucket_name,
+        "Key": path,
+        "UploadId": file_id,
+        "MultipartUpload": {"Parts": parts},
+    }
+
+    s3 = clients.get_client("s3")
+    s3.complete_multipart_upload(**multipart_params)
+
+
+def completed_before(bucket_name: str, path: str, err: Exception) -> bool:
+    """Check whether a failed completion was already done by an earlier invocation.
+
+    Asynchronous invocations are delivered at least once, a duplicate finds the
+    upload gone and the object in place.
+    """
+    from botocore.exceptions import ClientError
+
+    if not isinstance(err, ClientError):
+        return False
+    if err.response["Error"]["Code"] != "NoSuchUpload":
+        return False
+
+    s3 = clients.get_client("s3")
+    try:
+        s3.head_object(Bucket=bucket_name, Key=path)
+    except ClientError:
+        return False
+    return True
+
+
+def finalize_token(path: str, file_id: str) -> str:
+    """Return the completion token of an upload.
 
+    The token is derived from the upload, so a retried request gets the same token.
+    """
+    return hashlib.sha256(f"{path}\n{file_id}".encode("utf-8")).hexdigest()[:32]
 
+
+def get_record(lst: LambdaSettings, token: str) -> Optional[dict]:
+    """Return the completion record of a token, or None if it does not exist."""
+    s3 = clients.get_client("s3")
+    try:
+        response = s3.get_object(
+            Bucket=lst.finalize_bucket_name, Key=f"{lst.finalize_prefix}{token}.json"
+        )
+    except s3.exceptions.NoSuchKey:
+        return None
+    return json.loads(response["Body"].read())
+
+
+def put_record(lst: LambdaSettings, token: str, record: dict):
+    """Store the completion record of a token."""
+    s3 = clients.get_client("s3")
+    s3.put_object(
+        Bucket=lst.finalize_bucket_name,
+        Key=f"{lst.finalize_prefix}{token}.json",
+        Body=json.dumps(record).encode("utf-8"),
+        ContentType="application/json",
+    )
+
+
+def start_async_finalize(lst: LambdaSettings, body: Request) -> dict:
+    """Store the parts and hand the completion to the finalize worker.
+
+    The parts are stored in S3, as a 10,000 part list exceeds the payload limit of
+    asynchronous lambda invocations. Pending and completed uploads are not started
+    again, failed ones are retried.
+    """
+    token = finalize_token(body.path, body.file_id)
+    record = get_record(lst, token)
+    if record is not None and record["status"] != "failed":
+        return {"token": token, "status": record["status"]}
+
+    record = {
+        "status": "pending",
+        "path": body.path,
+        "file_id": body.file_id,
+        "parts": body.parts.to_boto3(),
+    }
+    put_record(lst, token, record)
+
+    try:
+        lambda_client = clients.get_client("lambda")
+        lambda_client.invoke(
+            FunctionName=lst.finalize_worker_function,
+            InvocationType="Event",
+            Payload=json.dumps({"token": token}).encode("utf-8"),
+        )
+    except Exception as err:
+        put_record(lst, token, {**record, "status": "failed", "error": str(err)})
+        raise
+    return {"token": token, "status": "pending"}
+
+
+@bootstrap.lambda_handler
 def handler(event, context):
     """Lambda handler function finalize multipart upload."""
-    print(event)
+    log.payload(logger, "Request", event)
     lst = LambdaSettings()
     try:
-        utils.preprocess_api_event(event)
-        event = Request.parse_obj(event["body"])
+        event = Request.parse_obj(codec.decode_body(event))
         utils.verify_path_is_valid(event.path, extensions=lst.input_file_suffixes)
     except (
         UnsupportedPayloadException,
         UnsupportedTypeException,
         ValidationError,
     ) as err:
-        print(f"Payload validation error: {err}")
-        return APIResponse(statusCode=400, body=str(err)).dict()
-
-    # Sorting parts based on PartNumber
-    sorted_parts = sorted(event.parts, key=lambda x: x.PartNumber)
-
-    multipart_params = {
-        "Bucket": lst.bucket_name,
-        "Key": event.path,
-        "UploadId": event.file_id,
-        "MultipartUpload": {"Parts": [part.dict() for part in sorted_parts]},
-    }
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
+
+    if event.mode == "async":
+        if not lst.finalize_bucket_name or not lst.finalize_worker_function:
+            return codec.encode_response(
+                status_code=400, body="Asynchronous finalize is not configured"
+            )
+
+        return codec.encode_response(
+            status_code=202,
+            body=start_async_finalize(lst, event),
+            headers={
+                "Access-Control-Allow-Origin": "*",
+            },
+        )
 
     try:
-        s3 = boto3.client("s3")
-        s3.complete_multipart_upload(**multipart_params)
-        return APIResponse(
+        complete_upload(
+            lst.bucket_name,
+            event.path,
+            event.file_id,
+            event.parts.to_boto3(),
+        )
+        return codec.encode_response(
             body={"message": True},
             headers={
                 "Access-Control-Allow-Origin": "*",
             },
-        ).dict()
-    except (ClientError, Exception) as e:
-        print(e)
+        )
+    except Exception as e:
+        logger.exception("Error handling the request")
         raise e
+
+
+@bootstrap.lambda_handler
+def worker(event, context):
+    """Lambda handler function completing a multipart upload in the background."""
+    log.payload(logger, "Request", event)
+    lst = LambdaSettings()
+    token = event["token"]
+
+    record = get_record(lst, token)
+    if record is None or record["status"] != "pending":
+        logger.info(
+            "Nothing to finalize for %s: %s", token, record and record["status"]
+        )
+        return
+
+    status = {"path": record["path"], "file_id": record["file_id"]}
+    try:
+        complete_upload(
+            lst.bucket_name, record["path"], record["file_id"], record["parts"]
+        )
+    except Exception as err:
+        if not completed_before(lst.bucket_name, record["path"], err):
+            logger.error("Error completing the multipart upload: %s", err)
+            put_record(lst, token, {**status, "status": "failed", "error": str(err)})
+            return
+    put_record(lst, token, {**status, "status": "completed"})
+
+
+@bootstrap.lambda_handler
+def status(event, context):
+    """Lambda handler function reporting the status of an asynchronous finalize."""
+    log.payload(logger, "Request", event)
+    lst = LambdaSettings()
+    try:
+        event = StatusRequest.parse_obj(codec.decode_body(event))
+    except (UnsupportedPayloadException, ValidationError) as err:
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
+
+    record = get_record(lst, event.token)
+    if record is None:
+        return codec.encode_response(status_code=404, body="Unknown token")
+
+    record.pop("parts", None)
+    return codec.encode_response(
+        body={"token": event.token, **record},
+        headers={
+            "Access-Control-Allow-Origin": "*",
+        },
+    )
@@ -1,18 +1,23 @@
 import sys
 from pathlib import Path
-from typing import List
-
-import boto3
-from botocore.exceptions import ClientError
+from typing import List, Optional
 
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import bootstrap
+import clients
+import codec
+import log
+import planner
+import presigner
 import utils
 from errors import UnsupportedPayloadException, UnsupportedTypeException
-from models import APIRequest, APIResponse
+from models import APIRequest
 from models import Settings as BaseSettings
-from pydantic import ValidationError, constr
+from pydantic import ValidationError, conint, constr
+
+logger = log.get_logger(__name__)
 
 
 class LambdaSettings(BaseSettings):
@@ -20,47 +25,90 @@ class LambdaSettings(BaseSettings):
 
     bucket_name: str
     input_file_suffixes: List[str]
+    url_expires: int = 3600
+    upload_part_size: int = 8 * planner.MiB
+    single_put_max_size: int = 16 * planner.MiB
+    max_upload_concurrency: int = 15
 
 
 class Request(APIRequest):
     """API Request Payload."""
 
     path: constr(min_length=1, max_length=512)
+    size: Optional[conint(ge=0, le=planner.MAX_OBJECT_SIZE)] = None
+
+
+def create_multipart_upload(bucket_name: str, path: str) -> dict:
+    """Create a multipart upload and return its ``file_id`` and ``path``."""
+    s3_client = clients.get_client("s3")
+    multipart_params = {
+        "Bucket": bucket_name,
+        "Key": path,
+    }
+    multipart_upload = s3_client.create_multipart_upload(**multipart_params)
+    return {
+        "file_id": multipart_upload["UploadId"],
+        "path": multipart_upload["Key"],
+    }
+
+
+def plan_upload(lst: LambdaSettings, size: int) -> planner.UploadPlan:
+    """Plan the upload of a file of ``size`` bytes with the lambda settings."""
+    return planner.plan_upload(
+        size,
+        part_size=lst.upload_part_size,
+        single_put_max_size=lst.single_put_max_size,
+        max_concurrency=lst.max_upload_concurrency,
+    )
 
 
+def make_pre_signed_put_url(bucket_name: str, url_expiration: int, path: str) -> dict:
+    """Presign a single PUT of the whole file, skipping the multipart upload."""
+    s3 = presigner.presign_client()
+    signed_url = s3.generate_presigned_url(
+        "put_object",
+        Params={"Bucket": bucket_name, "Key": path},
+        ExpiresIn=int(url_expiration),
+    )
+    return {"path": path, "signedUrl": signed_url}
+
+
+def start_upload(lst: LambdaSettings, body: Request) -> dict:
+    """Start the upload, planned if the request contains the file size."""
+    if body.size is None:
+        return create_multipart_upload(lst.bucket_name, body.path)
+
+    plan = plan_upload(lst, body.size)
+    if plan.multipart:
+        upload = create_multipart_upload(lst.bucket_name, body.path)
+    else:
+        upload = make_pre_signed_put_url(lst.bucket_name, lst.url_expires, body.path)
+    return {**upload, "plan": plan.dict()}
+
+
+@bootstrap.lambda_handler
 def handler(event, context):
     """Lambda handler function initialize multipart upload."""
-    print(event)
+    log.payload(logger, "Request", event)
     lst = LambdaSettings()
     try:
-        utils.preprocess_api_event(event)
-        event = Request.parse_obj(event["body"])
+        event = Request.parse_obj(codec.decode_body(event))
         utils.verify_path_is_valid(event.path, extensions=lst.input_file_suffixes)
     except (
         UnsupportedPayloadException,
         UnsupportedTypeException,
         ValidationError,
     ) as err:
-        print(f"Payload validation error: {err}")
-        return APIResponse(statusCode=400, body=str(err)).dict()
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
 
-    s3_client = boto3.client("s3")
-    multipart_params = {
-        "Bucket": lst.bucket_name,
-        "Key": event.path,
-    }
     try:
-        multipart_upload = s3_client.create_multipart_upload(**multipart_params)
-
-        return APIResponse(
-            body={
-                "file_id": multipart_upload["UploadId"],
-                "path": multipart_upload["Key"],
-            },
+        return codec.encode_response(
+            body=start_upload(lst, event),
             headers={
                 "Access-Control-Allow-Origin": "*",
             },
-        ).dict()
-    except (ClientError, Exception) as e:
-        print(e)
+        )
+    except Exception as e:
+        logger.exception("Error handling the request")
         raise e  # Rethrowing the exception to be handled by AWS Lambda
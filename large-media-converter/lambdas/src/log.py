@@ -0,0 +1,132 @@
+"""Structured JSON line logging for the lambdas.
+
+Log calls use the standard library loggers, so messages are only formatted if their
+level is enabled. Every record is written as one JSON line; structured fields are
+passed as ``extra={"fields": {...}}`` and truncated per field. Full payload dumps
+(events, API responses, tool output) go through :func:`payload`, which only dumps a
+sample of them.
+
+Configured through ``models.Settings``: ``LOG_LEVEL``, ``LOG_MAX_FIELD_CHARS``,
+``LOG_MAX_ITEMS`` and ``LOG_PAYLOAD_SAMPLE_RATE``.
+"""
+
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import bootstrap
+
+ROOT_LOGGER = "lmu"
+REDACTED_KEYS = {"authorization", "cookie", "x-amz-security-token", "x-api-key"}
+
+context = {}
+
+
+def truncate(value, max_chars: int, max_items: int, depth: int = 0):
+    """Truncate long strings, long collections and deep nesting of a field.
+
+    Values of credential headers are redacted.
+    """
+    if isinstance(value, str):
+        if len(value) > max_chars:
+            return f"{value[:max_chars]}...(+{len(value) - max_chars} chars)"
+        return value
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if depth >= 4:
+        return truncate(repr(value), max_chars, max_items, depth)
+    if isinstance(value, dict):
+        items = {
+            str(key): "***"
+            if str(key).lower() in REDACTED_KEYS
+            else truncate(item, max_chars, max_items, depth + 1)
+            for key, item in itertools.islice(value.items(), max_items)
+        }
+        if len(value) > max_items:
+            items["..."] = f"+{len(value) - max_items} keys"
+        return items
+    if isinstance(value, (list, tuple, set)):
+        items = [
+            truncate(item, max_chars, max_items, depth + 1)
+            for item in itertools.islice(value, max_items)
+        ]
+        if len(value) > max_items:
+            items.append(f"...(+{len(value) - max_items} items)")
+        return items
+    return truncate(str(value), max_chars, max_items, depth)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as JSON lines with truncated fields."""
+
+    def __init__(self, max_chars: int = 1000, max_items: int = 20):
+        super().__init__()
+        self.max_chars = max_chars
+        self.max_items = max_items
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": truncate(record.getMessage(), self.max_chars, self.max_items),
+            **context,
+        }
+        for key, value in getattr(record, "fields", {}).items():
+            entry[key] = truncate(value, self.max_chars, self.max_items)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, separators=(",", ":"))
+
+
+def configure():
+    """Set up the JSON line handler once per container."""
+    logger = logging.getLogger(ROOT_LOGGER)
+    if logger.handlers:
+        return
+
+    settings = bootstrap.settings()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        JsonFormatter(settings.log_max_field_chars, settings.log_max_items)
+    )
+    logger.addHandler(handler)
+    logger.setLevel(settings.log_level.upper())
+    logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the logger of a lambda module."""
+    configure()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name.rsplit('.', 1)[-1]}")
+
+
+def bind(**fields):
+    """Add fields to every following record, e.g. the request id."""
+    context.update({key: value for key, value in fields.items() if value is not None})
+
+
+def payload(logger: logging.Logger, message: str, value, **fields):
+    """Log a payload, dumped in full for debug logging or a sample of the calls.
+
+    Other calls only log the keys of the payload.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    sample_rate = bootstrap.settings().log_payload_sample_rate
+    if logger.isEnabledFor(logging.DEBUG) or random.random() < sample_rate:
+        fields["payload"] = value
+    elif isinstance(value, dict):
+        fields["payload_keys"] = list(value)
+    else:
+        fields["payload_type"] = type(value).__name__
+    logger.info(message, extra={"fields": fields})
@@ -7,11 +7,16 @@ from pydantic import ValidationError, constr
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import bootstrap
+import codec
+import log
 import utils
 from errors import UnsupportedPayloadException, UnsupportedTypeException
-from models import APIRequest, APIResponse
+from models import APIRequest
 from models import Settings as BaseSettings
 
+logger = log.get_logger(__name__)
+
 
 class LambdaSettings(BaseSettings):
     """Lambda Settings."""
@@ -25,16 +30,16 @@ class Request(APIRequest):
     path: constr(min_length=1, max_length=512)
 
 
+@bootstrap.lambda_handler
 def handler(event, context):
     """Lambda handler function to get file infos."""
 
-    print(f"REQUEST:: {event}")
+    log.payload(logger, "Request", event)
 
     lst = LambdaSettings()
 
     try:
-        utils.preprocess_api_event(event)
-        event = Request.parse_obj(event["body"])
+        event = Request.parse_obj(codec.decode_body(event))
 
         if not event.path.startswith("s3://"):
             raise UnsupportedPayloadException(f"Not an S3 file path: {event.path}")
@@ -44,18 +49,18 @@ def handler(event, context):
         UnsupportedTypeException,
         ValidationError,
     ) as err:
-        print(f"Payload validation error: {err}")
-        return APIResponse(statusCode=400, body=str(err)).dict()
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
 
     try:
         info = utils.get_media_info_from_s3_url(event.path)
 
         if info is None:
-            return APIResponse(
-                statusCode=500, body="No media information found."
-            ).dict()
+            return codec.encode_response(
+                status_code=500, body="No media information found."
+            )
 
-        return APIResponse(
+        return codec.encode_response(
             body={
                 "filename": info["FileName"],
                 "file_extension": info["FileExtension"],
@@ -68,8 +73,8 @@ def handler(event, context):
             headers={
                 "Access-Control-Allow-Origin": "*",
             },
-        ).dict()
+        )
 
     except Exception as e:
-        print(e)
+        logger.exception("Error handling the request")
         raise e
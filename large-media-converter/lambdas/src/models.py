@@ -12,6 +12,19 @@ class Settings(BaseSettings):
     sentry_dsn: str = ""
     sentry_traces_sample_rate: float = 0.1
 
+    boto_max_pool_connections: int = 10
+    boto_tcp_keepalive: bool = True
+
+    api_max_body_bytes: int = 2 * 1024**2
+    api_literal_bodies: bool = True
+
+    log_level: str = "INFO"
+    log_max_field_chars: int = 1000
+    log_max_items: int = 20
+    log_payload_sample_rate: float = 0.01
+
+    record_concurrency: int = 8
+
 
 class BaseModelExtra(BaseModel):
     """BaseModel with extra fields."""
@@ -65,6 +78,7 @@ class APIResponse(APIRequest):
     statusCode: int = 200
     body: str
     headers: dict = {}
+    isBase64Encoded: bool = False
 
     @validator("body", pre=True, always=True)
     def set_body_json(cls, value):
@@ -0,0 +1,82 @@
+"""Compact part lists of multipart uploads."""
+
+from array import array
+from typing import List
+
+MAX_PARTS = 10000
+
+
+class PartList:
+    """Uploaded parts in part number order, for ``complete_multipart_upload``.
+
+    The part numbers are kept in a typed array and the ETags in a single list instead
+    of one model object per part. Parsing validates every part in one pass and places
+    its ETag by part number, so no sort is needed.
+
+    Used as pydantic field type, validation errors are reported as ValidationError.
+    """
+
+    __slots__ = ("numbers", "etags")
+
+    def __init__(self, etags: List[str]):
+        self.numbers = array("H", range(1, len(etags) + 1))
+        self.etags = etags
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value) -> "PartList":
+        """Validate a part list, as parsed from JSON."""
+        if isinstance(value, cls):
+            return value
+        return cls.parse(value)
+
+    @classmethod
+    def parse(cls, parts: list) -> "PartList":
+        """Parse a list of ``{"PartNumber", "ETag"}`` dicts.
+
+        The part numbers must be exactly 1 to N in any order: duplicates and gaps are
+        rejected, as S3 would otherwise complete an upload with parts missing.
+        """
+        if not isinstance(parts, (list, tuple)):
+            raise TypeError("parts must be a list")
+        count = len(parts)
+        if not 0 < count <= MAX_PARTS:
+            raise ValueError(f"parts must contain 1 to {MAX_PARTS} parts")
+
+        etags = [None] * count
+        for part in parts:
+            try:
+                number = part["PartNumber"]
+                etag = part["ETag"]
+            except (KeyError, TypeError):
+                raise ValueError("every part must contain a PartNumber and an ETag")
+
+            if isinstance(number, str) and number.isdigit():
+                number = int(number)
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise TypeError(f"PartNumber must be an integer: {number!r}")
+            if not isinstance(etag, str) or not etag:
+                raise TypeError(f"ETag of part {number} must be a non-empty string")
+            if not 0 < number <= count:
+                raise ValueError(
+                    f"PartNumber {number} out of range, parts must be numbered "
+                    f"1 to {count} without gaps"
+                )
+            if etags[number - 1] is not None:
+                raise ValueError(f"PartNumber {number} is duplicated")
+            etags[number - 1] = etag
+
+        return cls(etags)
+
+    def __len__(self) -> int:
+        return len(self.etags)
+
+    def to_boto3(self) -> List[dict]:
+        """Return the ``MultipartUpload.Parts`` payload of ``complete_multipart_upload``."""
+        return [
+            {"PartNumber": number, "ETag": etag}
+            for number, etag in zip(self.numbers, self.etags)
+        ]
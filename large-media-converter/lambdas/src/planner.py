@@ -0,0 +1,56 @@
+"""Upload planning within the S3 multipart upload limits."""
+
+import math
+
+from pydantic import BaseModel
+
+MiB = 1024**2
+GiB = 1024**3
+
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * MiB
+MAX_PART_SIZE = 5 * GiB
+MAX_PUT_SIZE = 5 * GiB
+MAX_OBJECT_SIZE = 5 * 1024 * GiB
+
+
+class UploadPlan(BaseModel):
+    """Upload Plan."""
+
+    multipart: bool
+    size: int
+    part_size: int
+    parts: int
+    concurrency: int
+
+
+def plan_upload(
+    size: int,
+    part_size: int = 8 * MiB,
+    single_put_max_size: int = 16 * MiB,
+    max_concurrency: int = 15,
+) -> UploadPlan:
+    """Plan how a file of ``size`` bytes is uploaded.
+
+    Files up to ``single_put_max_size`` are uploaded with a single PUT. Larger files
+    use parts of at least ``part_size``, grown in whole MiB until the file fits into
+    the S3 limit of 10,000 parts.
+    """
+    if size > MAX_OBJECT_SIZE:
+        raise ValueError(f"File size exceeds the S3 object limit: {size}")
+
+    if size <= min(single_put_max_size, MAX_PUT_SIZE):
+        return UploadPlan(
+            multipart=False, size=size, part_size=size, parts=1, concurrency=1
+        )
+
+    min_size = math.ceil(size / MAX_PARTS / MiB) * MiB
+    part_size = min(max(part_size, MIN_PART_SIZE, min_size), MAX_PART_SIZE)
+    parts = math.ceil(size / part_size)
+    return UploadPlan(
+        multipart=True,
+        size=size,
+        part_size=part_size,
+        parts=parts,
+        concurrency=max(1, min(max_concurrency, parts)),
+    )
@@ -1,20 +1,23 @@
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError
-from pydantic import ValidationError, conint, constr
+from pydantic import ValidationError, conint, constr, validator
 
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import bootstrap
+import codec
+import log
+import presigner
 import utils
 from errors import UnsupportedPayloadException, UnsupportedTypeException
-from models import APIRequest, APIResponse
+from models import APIRequest
 from models import Settings as BaseSettings
 
+logger = log.get_logger(__name__)
+
 
 class LambdaSettings(BaseSettings):
     """Lambda Settings."""
@@ -22,6 +25,8 @@ class LambdaSettings(BaseSettings):
     bucket_name: str
     input_file_suffixes: List[str]
     url_expires: int = 3600
+    gzip_min_bytes: int = 1024
+    max_parts_per_request: int = 10000
 
 
 class Request(APIRequest):
@@ -29,61 +34,127 @@ class Request(APIRequest):
 
     path: constr(min_length=1, max_length=512)
     file_id: constr(min_length=1, max_length=1024)
-    parts: conint(ge=1)
+    parts: conint(ge=1, le=10000)
+    format: Literal["urls", "compact"] = "urls"
+    start_part: conint(ge=1) = 1
+    max_parts: Optional[conint(ge=1)] = None
+
+    @validator("start_part")
+    def start_part_within_parts(cls, value, values):
+        """Reject windows starting after the last part."""
+        if "parts" in values and value > values["parts"]:
+            raise ValueError(f"start_part must not exceed parts ({values['parts']})")
+        return value
+
+
+def part_window(body: Request, max_parts_per_request: int) -> List[int]:
+    """Return the part numbers of the requested window, bounded by the server."""
+    size = min(body.max_parts or body.parts, max_parts_per_request)
+    return list(range(body.start_part, min(body.parts, body.start_part + size - 1) + 1))
+
+
+def next_part(body: Request, part_numbers: List[int]) -> Optional[int]:
+    """Return the cursor of the next window, or None after the last part."""
+    if part_numbers[-1] < body.parts:
+        return part_numbers[-1] + 1
+    return None
 
 
-def make_pre_signed_urls(bucket_name: str, url_expiration: int, body: Request):
-    s3 = boto3.client("s3", config=Config(s3={"use_accelerate_endpoint": True}))
+def make_pre_signed_urls(
+    bucket_name: str, url_expiration: int, body: Request, part_numbers: List[int]
+):
+    s3 = presigner.presign_client()
 
     try:
-        signed_urls = []
-
-        for index in range(body.parts):
-            params = {
-                "Bucket": bucket_name,
-                "Key": body.path,
-                "UploadId": body.file_id,
-                "PartNumber": index + 1,
-            }
-            signed_url = s3.generate_presigned_url(
-                "upload_part", Params=params, ExpiresIn=int(url_expiration)
-            )
-            # Switching naming style for compatible with complete_multipart_upload
-            signed_urls.append({"signedUrl": signed_url, "PartNumber": index + 1})
+        signed_urls = presigner.presign_upload_parts(
+            s3, bucket_name, body.path, body.file_id, part_numbers, url_expiration
+        )
+
+        # Switching naming style for compatible with complete_multipart_upload
+        return [
+            {"signedUrl": signed_url, "PartNumber": part_number}
+            for signed_url, part_number in zip(signed_urls, part_numbers)
+        ]
+    except Exception as e:
+        logger.error("Error generating pre-signed URLs: %s", e)
+        raise
+
 
-        return signed_urls
+def make_compact_pre_signed_urls(
+    bucket_name: str, url_expiration: int, body: Request, part_numbers: List[int]
+):
+    """Presign all parts as one URL template plus a signature per part.
+
+    Falls back to the full URL list if the client cannot sign from a template.
+    """
+    s3 = presigner.presign_client()
+
+    try:
+        compact = presigner.presign_upload_part_signatures(
+            s3, bucket_name, body.path, body.file_id, part_numbers, url_expiration
+        )
     except Exception as e:
-        print(f"Error generating pre-signed URLs: {str(e)}")
+        logger.error("Error generating pre-signed URLs: %s", e)
         raise
 
+    if compact is None:
+        return {
+            "parts": make_pre_signed_urls(
+                bucket_name, url_expiration, body, part_numbers
+            )
+        }
+
+    template, signatures = compact
+    return {
+        "format": "compact",
+        "template": template,
+        "firstPart": part_numbers[0],
+        "signatures": signatures,
+    }
+
+
+def presign_window(lst: LambdaSettings, body: Request) -> dict:
+    """Presign the requested window of parts in the requested format."""
+    part_numbers = part_window(body, lst.max_parts_per_request)
+    if body.format == "compact":
+        response = make_compact_pre_signed_urls(
+            lst.bucket_name, lst.url_expires, body, part_numbers
+        )
+    else:
+        response = {
+            "parts": make_pre_signed_urls(
+                lst.bucket_name, lst.url_expires, body, part_numbers
+            )
+        }
+    response["nextPart"] = next_part(body, part_numbers)
+    return response
+
 
+@bootstrap.lambda_handler
 def handler(event, context):
     """Lambda handler function initialize multipart upload."""
-    print(event)
+    log.payload(logger, "Request", event)
     lst = LambdaSettings()
+    headers = event.get("headers")
     try:
-        utils.preprocess_api_event(event)
-        event = Request.parse_obj(event["body"])
+        event = Request.parse_obj(codec.decode_body(event))
         utils.verify_path_is_valid(event.path, extensions=lst.input_file_suffixes)
     except (
         UnsupportedPayloadException,
         UnsupportedTypeException,
         ValidationError,
     ) as err:
-        print(f"Payload validation error: {err}")
-        return APIResponse(statusCode=400, body=str(err)).dict()
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
 
     try:
-        part_signed_url_list = make_pre_signed_urls(
-            lst.bucket_name, lst.url_expires, event
-        )
-
-        return APIResponse(
-            body={"parts": part_signed_url_list},
+        response = codec.encode_response(
+            body=presign_window(lst, event),
             headers={
                 "Access-Control-Allow-Origin": "*",
             },
-        ).dict()
-    except (ClientError, Exception) as e:
-        print(e)
+        )
+        return utils.gzip_api_response(response, headers, lst.gzip_min_bytes)
+    except Exception as e:
+        logger.exception("Error handling the request")
         raise e
@@ -0,0 +1,212 @@
+"""Batch SigV4 presigning of S3 multipart upload part URLs.
+
+Presigned ``upload_part`` URLs of one upload only differ in their ``partNumber``. The
+signing key, the credential scope and the canonical request are derived once from a URL
+signed by botocore, then a signature is stamped out per part number. The result is byte
+identical to ``generate_presigned_url`` called once per part.
+"""
+
+import hashlib
+import hmac
+import sys
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import clients
+import log
+
+logger = log.get_logger(__name__)
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+
+
+def presign_client():
+    """Return the S3 client used to presign upload URLs.
+
+    The client signs with SigV4, as the region default for presigning is SigV2.
+    """
+    from botocore.config import Config
+
+    return clients.get_client(
+        "s3",
+        config=Config(signature_version="s3v4", s3={"use_accelerate_endpoint": True}),
+    )
+
+
+class PresignTemplateError(ValueError):
+    """Raised when a presigned URL cannot be used as a signing template."""
+
+
+class PartPresigner:
+    """Presigns ``upload_part`` URLs from a SigV4 template URL.
+
+    :param template_url: A SigV4 presigned ``upload_part`` URL signed by botocore.
+    :param secret_key: The secret key the template URL was signed with.
+    """
+
+    def __init__(self, template_url: str, secret_key: str):
+        url = urlsplit(template_url)
+        pairs = [pair.partition("=") for pair in url.query.split("&")]
+        params = {key: value for key, _, value in pairs}
+
+        if params.get("X-Amz-Algorithm") != ALGORITHM:
+            raise PresignTemplateError("Template URL is not signed with SigV4")
+        if unquote(params.get("X-Amz-SignedHeaders", "")) != "host":
+            raise PresignTemplateError("Template URL signs more than the host header")
+        if pairs[-1][0] != "X-Amz-Signature" or "partNumber" not in params:
+            raise PresignTemplateError("Template URL is not an upload_part URL")
+
+        self.signature = params["X-Amz-Signature"]
+        self.part_number = int(params["partNumber"])
+
+        # URL: everything up to the part number and between it and the signature
+        query = [f"{key}={value}" for key, _, value in pairs[:-1]]
+        index = [key for key, _, _ in pairs].index("partNumber")
+        self._url_head = f"{url.scheme}://{url.netloc}{url.path}?" + "&".join(
+            query[:index] + ["partNumber="]
+        )
+        self._url_tail = "&".join([""] + query[index + 1 :]) + "&X-Amz-Signature="
+
+        # Canonical request: sorted query around the part number
+        canonical = sorted(
+            (key, value) for key, _, value in pairs[:-1] if key != "partNumber"
+        )
+        before = [f"{key}={value}" for key, value in canonical if key < "partNumber"]
+        after = [f"{key}={value}" for key, value in canonical if key > "partNumber"]
+        self._request_head = hashlib.sha256(
+            "\n".join(["PUT", url.path, ""]).encode("utf-8")
+            + "&".join(before + ["partNumber="]).encode("utf-8")
+        )
+        self._request_tail = (
+            "&".join([""] + after)
+            + "\n"
+            + "\n".join([f"host:{url.netloc}", "", "host", UNSIGNED_PAYLOAD])
+        ).encode("utf-8")
+
+        # String to sign and signing key
+        timestamp = params["X-Amz-Date"]
+        access_key, date, region, service, terminator = unquote(
+            params["X-Amz-Credential"]
+        ).split("/")
+        self._string_head = "\n".join(
+            [ALGORITHM, timestamp, "/".join([date, region, service, terminator]), ""]
+        ).encode("utf-8")
+
+        key = f"AWS4{secret_key}".encode("utf-8")
+        for part in (date, region, service, terminator):
+            key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+        self._signer = hmac.new(key, digestmod=hashlib.sha256)
+
+    @property
+    def template(self) -> str:
+        """URL with ``{PartNumber}`` and ``{signature}`` placeholders."""
+        return f"{self._url_head}{{PartNumber}}{self._url_tail}{{signature}}"
+
+    def signature_of(self, part_number: int) -> str:
+        """Return the hex signature of a single part."""
+        request = self._request_head.copy()
+        request.update(str(part_number).encode("ascii"))
+        request.update(self._request_tail)
+
+        signer = self._signer.copy()
+        signer.update(self._string_head)
+        signer.update(request.hexdigest().encode("ascii"))
+        return signer.hexdigest()
+
+    def sign(self, part_number: int) -> str:
+        """Return the presigned URL of a single part."""
+        signature = self.signature_of(part_number)
+        return f"{self._url_head}{part_number}{self._url_tail}{signature}"
+
+    def verify(self) -> bool:
+        """Check that the template reproduces the signature botocore computed."""
+        return self.sign(self.part_number).endswith(
+            f"&X-Amz-Signature={self.signature}"
+        )
+
+    def sign_many(self, part_numbers: Iterable[int]) -> List[str]:
+        """Return the presigned URLs of all given parts."""
+        return [self.sign(part_number) for part_number in part_numbers]
+
+
+def _botocore_presigner(
+    s3, bucket: str, key: str, upload_id: str, expires_in: int
+) -> Callable[[int], str]:
+    """Return a function presigning a single part with botocore."""
+
+    def botocore_presign(part_number: int) -> str:
+        return s3.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": bucket,
+                "Key": key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=int(expires_in),
+        )
+
+    return botocore_presign
+
+
+def _template_presigner(s3, template_url: str) -> Optional[PartPresigner]:
+    """Return a verified presigner for ``template_url`` or None if unusable."""
+    try:
+        credentials = s3._request_signer._credentials.get_frozen_credentials()
+        presigner = PartPresigner(template_url, credentials.secret_key)
+    except (AttributeError, PresignTemplateError) as err:
+        logger.warning("Falling back to botocore presigning: %s", err)
+        return None
+
+    if not presigner.verify():
+        logger.warning("Falling back to botocore presigning: template does not verify")
+        return None
+    return presigner
+
+
+def presign_upload_parts(
+    s3, bucket: str, key: str, upload_id: str, part_numbers: List[int], expires_in: int
+) -> List[str]:
+    """Presign ``upload_part`` URLs for all ``part_numbers`` of a multipart upload.
+
+    The first part is signed by botocore and used as template for the others. If the
+    client does not sign with SigV4 or the template does not reproduce botocore's
+    signature, every part is signed by botocore instead.
+    """
+    if not part_numbers:
+        return []
+
+    botocore_presign = _botocore_presigner(s3, bucket, key, upload_id, expires_in)
+    template_url = botocore_presign(part_numbers[0])
+    presigner = _template_presigner(s3, template_url)
+
+    if presigner is None:
+        return [template_url] + [botocore_presign(n) for n in part_numbers[1:]]
+    return [template_url] + presigner.sign_many(part_numbers[1:])
+
+
+def presign_upload_part_signatures(
+    s3, bucket: str, key: str, upload_id: str, part_numbers: List[int], expires_in: int
+) -> Optional[Tuple[str, List[str]]]:
+    """Presign ``upload_part`` URLs as one shared template plus a signature per part.
+
+    Substituting ``{PartNumber}`` and ``{signature}`` in the template yields the same
+    URLs as :func:`presign_upload_parts`.
+
+    :return: The template and the signatures in order of ``part_numbers``, or None if
+        the client does not sign with SigV4.
+    """
+    if not part_numbers:
+        return None
+
+    botocore_presign = _botocore_presigner(s3, bucket, key, upload_id, expires_in)
+    presigner = _template_presigner(s3, botocore_presign(part_numbers[0]))
+
+    if presigner is None:
+        return None
+    return presigner.template, [presigner.signature_of(n) for n in part_numbers]
@@ -1,3 +1,4 @@
+import functools
 import sys
 from pathlib import Path
 from typing import List
@@ -6,11 +7,16 @@ from uuid import uuid4
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import batch
+import bootstrap
+import log
 import utils
 from errors import UnsupportedExtensionException
 from models import JobStatus
 from models import Settings as BaseSettings
 
+logger = log.get_logger(__name__)
+
 
 class LambdaSettings(BaseSettings):
     """Lambda Settings."""
@@ -21,13 +27,8 @@ class LambdaSettings(BaseSettings):
     input_file_suffixes: List[str]
 
 
-def handler(event, context):
-    """Lambda handler function to process audio."""
-
-    print(f"REQUEST:: {event}")
-
-    lst = LambdaSettings()
-    event = utils.convert_sns_event_to_s3_event(event)
+def process_record(lst: LambdaSettings, context, event: dict):
+    """Move an audio file of a single object S3 event to the destination bucket."""
     src_bucket, src_file = utils.retrive_sources_from_s3(event)
 
     try:
@@ -53,10 +54,20 @@ def handler(event, context):
     except UnsupportedExtensionException as err:
         # We are ignoring unsupported file extensions as the are being
         # processed by other lambdas
-        print(f"Ignoring unsupported file extension: {src_file}")
+        logger.info("Ignoring unsupported file extension: %s", src_file)
     except Exception as err:
         log_group = context.log_group_name if context else "unknown"
         utils.send_exception(lst.sns_topic_arn, log_group, str(err), path=src_file)
         raise err
 
-    return
+
+@bootstrap.lambda_handler
+def handler(event, context):
+    """Lambda handler function to process audio."""
+
+    log.payload(logger, "Request", event)
+
+    lst = LambdaSettings()
+    return batch.handle_event(
+        event, functools.partial(process_record, lst, context), lst.record_concurrency
+    )
@@ -0,0 +1,115 @@
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import ValidationError, conint, constr
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import bootstrap
+import clients
+import codec
+import log
+import utils
+from errors import UnsupportedPayloadException, UnsupportedTypeException
+from models import APIRequest
+from models import Settings as BaseSettings
+
+logger = log.get_logger(__name__)
+
+
+class LambdaSettings(BaseSettings):
+    """Lambda Settings."""
+
+    bucket_name: str
+    input_file_suffixes: List[str]
+    gzip_min_bytes: int = 1024
+
+
+class Request(APIRequest):
+    """API Request."""
+
+    path: constr(min_length=1, max_length=512)
+    file_id: constr(min_length=1, max_length=1024)
+    parts: Optional[conint(ge=1, le=10000)] = None
+
+
+def list_uploaded_parts(bucket_name: str, path: str, file_id: str) -> List[dict]:
+    """Return the uploaded parts of a multipart upload, ordered by part number.
+
+    ListParts returns at most 1000 parts per page, so a 10,000 part upload takes ten
+    requests.
+    """
+    s3 = clients.get_client("s3")
+    paginator = s3.get_paginator("list_parts")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Key=path,
+        UploadId=file_id,
+        PaginationConfig={"PageSize": 1000},
+    )
+    return [
+        {
+            "PartNumber": part["PartNumber"],
+            "ETag": part["ETag"].strip('"'),
+            "Size": part["Size"],
+        }
+        for page in pages
+        for part in page.get("Parts", [])
+    ]
+
+
+def missing_ranges(uploaded: List[int], parts: int) -> List[List[int]]:
+    """Return the inclusive ranges of part numbers up to ``parts`` not uploaded yet."""
+    ranges = []
+    start = 1
+    for part_number in sorted(uploaded) + [parts + 1]:
+        if part_number > parts + 1:
+            break
+        if part_number > start:
+            ranges.append([start, part_number - 1])
+        start = max(start, part_number + 1)
+    return ranges
+
+
+@bootstrap.lambda_handler
+def handler(event, context):
+    """Lambda handler function to list the uploaded parts of a multipart upload."""
+    log.payload(logger, "Request", event)
+    lst = LambdaSettings()
+    headers = event.get("headers")
+    try:
+        event = Request.parse_obj(codec.decode_body(event))
+        utils.verify_path_is_valid(event.path, extensions=lst.input_file_suffixes)
+    except (
+        UnsupportedPayloadException,
+        UnsupportedTypeException,
+        ValidationError,
+    ) as err:
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
+
+    from botocore.exceptions import ClientError
+
+    try:
+        uploaded = list_uploaded_parts(lst.bucket_name, event.path, event.file_id)
+    except ClientError as err:
+        if err.response["Error"]["Code"] != "NoSuchUpload":
+            raise
+        logger.warning("Upload not found: %s", err)
+        return codec.encode_response(status_code=404, body=str(err))
+
+    body = {"path": event.path, "file_id": event.file_id, "parts": uploaded}
+    if event.parts is not None:
+        body["missing"] = missing_ranges(
+            [part["PartNumber"] for part in uploaded], event.parts
+        )
+
+    response = codec.encode_response(
+        body=body,
+        headers={
+            "Access-Control-Allow-Origin": "*",
+        },
+    )
+    return utils.gzip_api_response(response, headers, lst.gzip_min_bytes)
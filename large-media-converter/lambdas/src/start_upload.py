@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+from typing import Literal, Optional
+
+root_folder = Path(__file__).parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+import bootstrap
+import codec
+import initialize
+import log
+import presign_urls
+import utils
+from errors import UnsupportedPayloadException, UnsupportedTypeException
+from pydantic import ValidationError, conint, root_validator
+
+logger = log.get_logger(__name__)
+
+
+class LambdaSettings(initialize.LambdaSettings, presign_urls.LambdaSettings):
+    """Lambda Settings."""
+
+
+class Request(initialize.Request):
+    """API Request Payload."""
+
+    parts: Optional[conint(ge=1, le=10000)] = None
+    format: Literal["urls", "compact"] = "urls"
+    max_parts: Optional[conint(ge=1)] = None
+
+    @root_validator(skip_on_failure=True)
+    def parts_or_size(cls, values):
+        """Require either the number of parts or the file size to plan them."""
+        if (values.get("parts") is None) == (values.get("size") is None):
+            raise ValueError("Either parts or size must be given")
+        return values
+
+
+@bootstrap.lambda_handler
+def handler(event, context):
+    """Lambda handler function to start a multipart upload with its first part URLs."""
+    log.payload(logger, "Request", event)
+    lst = LambdaSettings()
+    headers = event.get("headers")
+    try:
+        event = Request.parse_obj(codec.decode_body(event))
+        utils.verify_path_is_valid(event.path, extensions=lst.input_file_suffixes)
+    except (
+        UnsupportedPayloadException,
+        UnsupportedTypeException,
+        ValidationError,
+    ) as err:
+        logger.warning("Payload validation error: %s", err)
+        return codec.encode_response(status_code=400, body=str(err))
+
+    try:
+        upload = initialize.start_upload(lst, event)
+        if "file_id" in upload:
+            window = presign_urls.Request(
+                path=upload["path"],
+                file_id=upload["file_id"],
+                parts=event.parts or upload["plan"]["parts"],
+                format=event.format,
+                max_parts=event.max_parts,
+            )
+            upload.update(presign_urls.presign_window(lst, window))
+
+        response = codec.encode_response(
+            body=upload,
+            headers={
+                "Access-Control-Allow-Origin": "*",
+            },
+        )
+        return utils.gzip_api_response(response, headers, lst.gzip_min_bytes)
+    except Exception as e:
+        logger.exception("Error handling the request")
+        raise e
@@ -1,3 +1,4 @@
+import functools
 import json
 import subprocess
 import sys
@@ -5,24 +6,23 @@ from pathlib import Path
 from typing import List
 from uuid import uuid4
 
-import boto3
-import tenacity
 from pydantic import validate_arguments, validator
 
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
+import batch
+import bootstrap
+import clients
+import log
 import utils
 from errors import FFProbeException, InputFormatException, UnsupportedExtensionException
 from models import BaseModelExtra
 from models import Settings as BaseSettings
 
-ffprobe_retry = tenacity.retry(
-    stop=tenacity.stop_after_attempt(5),
-    wait=tenacity.wait_fixed(3),
-    retry=tenacity.retry_if_exception_type(FFProbeException),
-    reraise=True,
-)
+logger = log.get_logger(__name__)
+
+ffprobe_retry = bootstrap.retry_on(FFProbeException)
 
 
 class LambdaSettings(BaseSettings):
@@ -80,7 +80,7 @@ def get_default_convert_job(bucket: str, settings_file: str) -> Job:
 def update_job_settings(
     job: Job, input_path: str, output_path: str, metadata: dict, role: str
 ) -> Job:
-    print("Updating Job Settings with the source and destination details")
+    logger.debug("Updating Job Settings with the source and destination details")
     settings = job.Settings
 
     try:
@@ -105,10 +105,10 @@ def update_job_settings(
 
 @validate_arguments
 def submit_job(job: Job, endpoint: str):
-    mediaconvert = boto3.client("mediaconvert", endpoint_url=endpoint)
+    mediaconvert = clients.get_client("mediaconvert", endpoint_url=endpoint)
     try:
         mediaconvert.create_job(**job.dict())
-        print(f"Job submitted to MediaConvert!")
+        logger.info("Job submitted to MediaConvert")
     except Exception as err:
         raise Exception(f"Error submitting job to MediaConvert: {str(err)}")
 
@@ -125,12 +125,12 @@ def set_max_width_height(
         out["Width"] = width
         if width > max_width:
             out["Width"] = max_width
-            print(f"Setting width to {max_width}")
+            logger.info("Setting width to %d", max_width)
     else:
         out["Height"] = height
         if height > max_height:
             out["Height"] = max_height
-            print(f"Setting height to {max_height}")
+            logger.info("Setting height to %d", max_height)
     return job
 
 
@@ -181,14 +181,8 @@ def validate_input_probe(input_probe: dict):
     return input_probe
 
 
-def handler(event, context):
-    """Lambda handler function to submit a job to AWS Elemental
-    MediaConvert."""
-
-    print(f"REQUEST:: {event}")
-
-    lst = LambdaSettings()
-    event = utils.convert_sns_event_to_s3_event(event)
+def process_record(lst: LambdaSettings, context, event: dict):
+    """Submit a MediaConvert job for the video of a single object S3 event."""
     src_bucket, src_file = utils.retrive_sources_from_s3(event)
 
     try:
@@ -203,8 +197,9 @@ def handler(event, context):
         validate_input_probe(input_probe)
         width, height = get_width_height(input_probe)
 
-        print(f"INPUT:: {input_probe['format']}")
-        print(f"WxH:: {width}x{height}")
+        log.payload(
+            logger, "Input probed", input_probe["format"], width=width, height=height
+        )
 
         metadata = {
             "guid": str(uuid4()),
@@ -227,16 +222,27 @@ def handler(event, context):
 
         job = set_max_width_height(job, width, height, lst.max_width, lst.max_height)
 
-        print(f"JOB:: {job.json()}")
+        log.payload(logger, "Submitting job", job.dict())
         submit_job(job, lst.mediaconvert_endpoint)
 
     except UnsupportedExtensionException as err:
         # We are ignoring unsupported file extensions as the are being
         # processed by other lambdas
-        print(f"Ignoring unsupported file extension: {src_file}")
+        logger.info("Ignoring unsupported file extension: %s", src_file)
     except Exception as err:
         log_group = context.log_group_name if context else "unknown"
         utils.send_exception(lst.sns_topic_arn, log_group, str(err), path=src_file)
         raise err
 
-    return
+
+@bootstrap.lambda_handler
+def handler(event, context):
+    """Lambda handler function to submit a job to AWS Elemental
+    MediaConvert."""
+
+    log.payload(logger, "Request", event)
+
+    lst = LambdaSettings()
+    return batch.handle_event(
+        event, functools.partial(process_record, lst, context), lst.record_concurrency
+    )
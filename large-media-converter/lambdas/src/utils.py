@@ -1,5 +1,5 @@
-import ast
 import base64
+import gzip
 import json
 import subprocess
 import sys
@@ -7,46 +7,33 @@ import urllib.parse
 from pathlib import Path
 from typing import List, Union
 
-import boto3
-import sentry_sdk
-import tenacity
 from pydantic import validate_arguments
-from sentry_sdk.integrations.aws_lambda import AwsLambdaIntegration
 
 root_folder = Path(__file__).parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
-
+import bootstrap
+import clients
+import codec
+import log
 from errors import (
     MediaInfoException,
     NoEventBodyException,
     UnsupportedExtensionException,
     UnsupportedFileException,
 )
-from models import Settings, SNSError, SNSMessage
-
-sentry = sentry_sdk.init(
-    dsn=Settings().sentry_dsn,
-    integrations=[
-        AwsLambdaIntegration(),
-    ],
-    traces_sample_rate=Settings().sentry_traces_sample_rate,
-    environment=Settings().environment,
-)
+from models import SNSError, SNSMessage
 
-mediainfo_retry = tenacity.retry(
-    stop=tenacity.stop_after_attempt(5),
-    wait=tenacity.wait_fixed(3),
-    retry=tenacity.retry_if_exception_type(MediaInfoException),
-    reraise=True,
-)
+logger = log.get_logger(__name__)
+
+mediainfo_retry = bootstrap.retry_on(MediaInfoException)
 
 
 @validate_arguments
 def send_sns(topic: str, message: SNSMessage):
     """Send an SNS notification."""
-    print(f"Sending SNS notification: {message.json()}")
-    sns = boto3.client("sns")
+    log.payload(logger, "Sending SNS notification", message.dict())
+    sns = clients.get_client("sns")
 
     try:
         sns.publish(
@@ -61,8 +48,9 @@ def send_sns(topic: str, message: SNSMessage):
 @validate_arguments
 def send_exception(topic: str, log_group_name: str, err: str, path: Union[str, Path]):
     """Send an SNS notification with the error details."""
+    region = clients.get_client("sns").meta.region_name
     message = SNSError(
-        detail=f"https://console.aws.amazon.com/cloudwatch/home?region={boto3.Session().region_name}#logStream:group={log_group_name}",
+        detail=f"https://console.aws.amazon.com/cloudwatch/home?region={region}#logStream:group={log_group_name}",
         error=str(err),
         path=str(path),
     )
@@ -71,8 +59,8 @@ def send_exception(topic: str, log_group_name: str, err: str, path: Union[str, P
 
 @validate_arguments
 def get_json_from_s3(bucket: str, key: str) -> dict:
-    print(f"Downloading file: {key}, from S3: {bucket}")
-    s3 = boto3.client("s3")
+    logger.info("Downloading file: %s, from S3: %s", key, bucket)
+    s3 = clients.get_client("s3")
 
     try:
         response = s3.get_object(Bucket=bucket, Key=key)
@@ -95,7 +83,7 @@ def presign_url(bucket: str, key: str, expires_in=7200) -> str:
     :return: string
 
     """
-    s3 = boto3.client("s3")
+    s3 = clients.get_client("s3")
     url = s3.generate_presigned_url(
         ClientMethod="get_object",
         Params={"Bucket": bucket, "Key": key},
@@ -120,14 +108,34 @@ def assert_event_has_body(event: dict) -> bool:
 
 def preprocess_api_event(event: dict) -> dict:
     """Preprocess the API event."""
-    print(f"REQUEST:: {event}")
+    log.payload(logger, "Request", event)
     assert_event_has_body(event)
-    decode_base_64_event_body(event)
 
-    event["body"] = ast.literal_eval(event["body"])
+    event["body"] = codec.decode_body(event)
+    event["isBase64Encoded"] = False
     return event
 
 
+def gzip_api_response(response: dict, headers: dict, min_size: int = 1024) -> dict:
+    """Gzip the body of an API response if the client accepts it.
+
+    Bodies smaller than ``min_size`` bytes are returned unchanged.
+    """
+    accept_encoding = next(
+        (v for k, v in (headers or {}).items() if k.lower() == "accept-encoding"), ""
+    )
+    if "gzip" not in accept_encoding or len(response["body"]) < min_size:
+        return response
+
+    body = gzip.compress(response["body"].encode("utf-8"), compresslevel=6)
+    return {
+        **response,
+        "body": base64.b64encode(body).decode("ascii"),
+        "headers": {**response["headers"], "Content-Encoding": "gzip"},
+        "isBase64Encoded": True,
+    }
+
+
 def verify_path_is_valid(path: str, extensions: List[str] = None) -> bool:
     """Verify that the path is a file."""
     suffix = Path(path).suffix
@@ -196,11 +204,11 @@ def get_media_info_from_s3_url(s3_url: str) -> Union[dict, None]:
 
     presigned_url = presign_url(str(src_bucket), str(src_file))
 
-    print(f"PRE-SIGNED URL:: {presigned_url}")
+    logger.debug("Running mediainfo on s3://%s/%s", src_bucket, src_file)
 
     info = run_mediainfo(presigned_url)
 
-    print(f"INFO:: {info}")
+    log.payload(logger, "Media info", info)
 
     if info["media"] is None:
         return None
@@ -229,7 +237,7 @@ def copy(s3_url: str, target_bucket: str = None):
         # Does an inplace copy to set the content type
         target_bucket = bucket
 
-    s3 = boto3.client("s3")
+    s3 = clients.get_client("s3")
     s3.copy_object(
         Key=str(key),
         Bucket=target_bucket,
@@ -243,5 +251,5 @@ def copy(s3_url: str, target_bucket: str = None):
 def delete_s3_object(s3_url: str):
     """Delete an object from S3."""
     bucket, key = s3_url_to_bucket_and_key(s3_url)
-    s3 = boto3.client("s3")
+    s3 = clients.get_client("s3")
     s3.delete_object(Bucket=bucket, Key=key)
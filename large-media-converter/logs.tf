@@ -33,11 +33,31 @@ resource "aws_cloudwatch_log_group" "presigned_urls" {
   retention_in_days = 30
 }
 
+resource "aws_cloudwatch_log_group" "start_upload" {
+  name              = "/aws/lambda/${aws_lambda_function.start_upload.function_name}"
+  retention_in_days = 30
+}
+
+resource "aws_cloudwatch_log_group" "resume" {
+  name              = "/aws/lambda/${aws_lambda_function.resume.function_name}"
+  retention_in_days = 30
+}
+
 resource "aws_cloudwatch_log_group" "finalize" {
   name              = "/aws/lambda/${aws_lambda_function.finalize.function_name}"
   retention_in_days = 30
 }
 
+resource "aws_cloudwatch_log_group" "finalize_worker" {
+  name              = "/aws/lambda/${aws_lambda_function.finalize_worker.function_name}"
+  retention_in_days = 30
+}
+
+resource "aws_cloudwatch_log_group" "finalize_status" {
+  name              = "/aws/lambda/${aws_lambda_function.finalize_status.function_name}"
+  retention_in_days = 30
+}
+
 resource "aws_cloudwatch_log_group" "auth" {
   name              = "/aws/lambda/${aws_lambda_function.auth.function_name}"
   retention_in_days = 30
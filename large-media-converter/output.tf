@@ -51,10 +51,22 @@ output "ingress_gateway_api_presign" {
   value = aws_apigatewayv2_route.presign.route_key
 }
 
+output "ingress_gateway_api_start_upload" {
+  value = aws_apigatewayv2_route.start_upload.route_key
+}
+
+output "ingress_gateway_api_resume" {
+  value = aws_apigatewayv2_route.resume.route_key
+}
+
 output "ingress_gateway_api_finalize" {
   value = aws_apigatewayv2_route.finalize.route_key
 }
 
+output "ingress_gateway_api_finalize_status" {
+  value = aws_apigatewayv2_route.finalize_status.route_key
+}
+
 output "ingress_gateway_api_mediainfo" {
   value = aws_apigatewayv2_route.mediainfo.route_key
 }
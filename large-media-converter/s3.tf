@@ -2,6 +2,23 @@ resource "aws_s3_bucket" "media-config-bucket" {
   bucket = "${local.name}-media-config-bucket"
 }
 
+resource "aws_s3_bucket_lifecycle_configuration" "media-config-bucket" {
+  bucket = aws_s3_bucket.media-config-bucket.bucket
+
+  rule {
+    id     = "delete-finalize-records-after-${var.input_bucket_delete_after_days}-day"
+    status = "Enabled"
+
+    filter {
+      prefix = "finalize/"
+    }
+
+    expiration {
+      days = var.input_bucket_delete_after_days
+    }
+  }
+}
+
 # Input Bucket
 
 resource "aws_s3_bucket" "media-input-bucket" {
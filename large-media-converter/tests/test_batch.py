@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src import utils
+from lambdas.src.batch import (
+    BatchRecordException,
+    process_records,
+    raise_on_failures,
+    record_key,
+    s3_events,
+)
+
+
+def s3_record(key):
+    return {"s3": {"bucket": {"name": "bucket"}, "object": {"key": key}}}
+
+
+class TestBatch(unittest.TestCase):
+    """Test the batch processing of records."""
+
+    def test_s3_events(self):
+        """Test that SNS and S3 batches are split into single object events."""
+        sns_event = {
+            "Records": [
+                utils.convert_s3_event_to_sns_event(
+                    {"Records": [s3_record("a"), s3_record("b")]}
+                )["Records"][0],
+                utils.convert_s3_event_to_sns_event({"Records": [s3_record("c")]})[
+                    "Records"
+                ][0],
+            ]
+        }
+        s3_event = {"Records": [s3_record("d"), s3_record("e")]}
+
+        self.assertEqual(
+            [record_key(event) for event in s3_events(sns_event)], ["a", "b", "c"]
+        )
+        self.assertEqual(s3_events(s3_event)[1], {"Records": [s3_record("e")]})
+        self.assertEqual(s3_events({"Event": "s3:TestEvent"}), [])
+
+    def test_process_records(self):
+        """Test that every record is processed and failures are kept per record."""
+        events = [{"Records": [s3_record(str(i))]} for i in range(20)]
+        threads = set()
+
+        def func(event):
+            threads.add(threading.get_ident())
+            if int(record_key(event)) % 5 == 0:
+                raise ValueError(record_key(event))
+
+        failures = process_records(events, func, max_workers=4)
+
+        self.assertEqual(
+            [record_key(event) for event, _ in failures], ["0", "5", "10", "15"]
+        )
+        self.assertIsInstance(failures[0][1], ValueError)
+        self.assertLessEqual(len(threads), 4)
+
+    def test_process_single_record(self):
+        """Test that a single record is processed on the calling thread."""
+        threads = []
+        process_records([{}], lambda _: threads.append(threading.get_ident()), 4)
+        self.assertEqual(threads, [threading.get_ident()])
+
+    def test_raise_on_failures(self):
+        """Test that one failure is raised as is and several are combined."""
+        raise_on_failures([], 3)
+
+        first = ({"Records": [s3_record("a")]}, ValueError("a"))
+        second = ({"Records": [s3_record("b")]}, KeyError("b"))
+        with self.assertRaises(ValueError):
+            raise_on_failures([first], 3)
+        with self.assertRaisesRegex(
+            BatchRecordException, "2 of 3 records failed: a, b"
+        ):
+            raise_on_failures([first, second], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
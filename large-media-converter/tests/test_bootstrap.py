@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src import bootstrap
+from lambdas.src.models import Settings
+
+
+class TestBootstrap(unittest.TestCase):
+    """Test the lazy bootstrap."""
+
+    def setUp(self):
+        bootstrap._sentry_initialized = False
+        bootstrap.settings.cache_clear()
+
+    def tearDown(self):
+        bootstrap.settings.cache_clear()
+
+    def test_settings_parsed_once(self):
+        """Test that the settings are cached."""
+        self.assertIs(bootstrap.settings(), bootstrap.settings())
+
+    def test_init_sentry_without_dsn(self):
+        """Test that Sentry is skipped without a DSN."""
+        sentry_sdk = MagicMock()
+        with patch.dict(sys.modules, {"sentry_sdk": sentry_sdk}):
+            self.assertFalse(bootstrap.init_sentry())
+        sentry_sdk.init.assert_not_called()
+
+    def test_init_sentry_once(self):
+        """Test that Sentry is initialized on the first call only."""
+        with patch.object(
+            bootstrap, "settings", return_value=Settings(sentry_dsn="https://k@s/1")
+        ), patch("sentry_sdk.init") as init:
+            self.assertTrue(bootstrap.init_sentry())
+            self.assertFalse(bootstrap.init_sentry())
+        init.assert_called_once()
+
+    def test_lambda_handler(self):
+        """Test that errors of the first invocation are reported."""
+
+        @bootstrap.lambda_handler
+        def handler(event, context):
+            raise ValueError(event)
+
+        with patch.object(
+            bootstrap, "settings", return_value=Settings(sentry_dsn="https://k@s/1")
+        ), patch("sentry_sdk.init"), patch(
+            "sentry_sdk.capture_exception"
+        ) as capture, patch(
+            "sentry_sdk.flush"
+        ):
+            with self.assertRaises(ValueError):
+                handler("first", None)
+            with self.assertRaises(ValueError):
+                handler("second", None)
+
+        capture.assert_called_once()
+
+    def test_retry_on(self):
+        """Test that the lazy retry decorator retries the given exception."""
+        calls = []
+
+        @bootstrap.retry_on(KeyError, attempts=3, wait=0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise KeyError("retry")
+            return len(calls)
+
+        self.assertEqual(flaky(), 3)
+
+        @bootstrap.retry_on(KeyError, attempts=3, wait=0)
+        def failing():
+            calls.append(1)
+            raise ValueError("no retry")
+
+        calls.clear()
+        with self.assertRaises(ValueError):
+            failing()
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
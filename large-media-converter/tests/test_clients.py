@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from botocore.config import Config
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.clients import ClientRegistry
+from lambdas.src.models import Settings
+
+
+class TestClientRegistry(unittest.TestCase):
+    """Test the boto3 client registry."""
+
+    def setUp(self):
+        os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
+        self.registry = ClientRegistry(max_pool_connections=25, tcp_keepalive=True)
+
+    def test_reuses_clients(self):
+        """Test that a second request returns the cached client."""
+        first = self.registry.client("s3")
+        second = self.registry.client("s3")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.stats(), {"hits": 1, "misses": 1, "clients": 1})
+
+    def test_key(self):
+        """Test that service, region, endpoint and config separate clients."""
+        s3 = self.registry.client("s3")
+
+        self.assertIsNot(s3, self.registry.client("sns"))
+        self.assertIsNot(s3, self.registry.client("s3", region_name="us-east-1"))
+        self.assertIsNot(
+            s3, self.registry.client("s3", endpoint_url="http://localhost:9000")
+        )
+        accelerated = self.registry.client(
+            "s3", config=Config(s3={"use_accelerate_endpoint": True})
+        )
+        self.assertIsNot(s3, accelerated)
+        self.assertIs(
+            accelerated,
+            self.registry.client(
+                "s3", config=Config(s3={"use_accelerate_endpoint": True})
+            ),
+        )
+        self.assertEqual(self.registry.misses, 5)
+
+    def test_connection_settings(self):
+        """Test that the pool size and keepalive are applied to every client."""
+        client = self.registry.client(
+            "s3", config=Config(s3={"use_accelerate_endpoint": True})
+        )
+
+        self.assertEqual(client.meta.config.max_pool_connections, 25)
+        self.assertTrue(client.meta.config.tcp_keepalive)
+        self.assertTrue(client.meta.config.s3["use_accelerate_endpoint"])
+
+    def test_settings_defaults(self):
+        """Test that the pool size is read from the settings."""
+        with patch("lambdas.src.clients.bootstrap.settings") as settings:
+            settings.return_value = Settings(boto_max_pool_connections=3)
+            client = ClientRegistry().client("s3")
+
+        self.assertEqual(client.meta.config.max_pool_connections, 3)
+
+    def test_clear(self):
+        """Test that clearing drops the clients and counters."""
+        first = self.registry.client("s3")
+        self.registry.clear()
+
+        self.assertEqual(self.registry.stats(), {"hits": 0, "misses": 0, "clients": 0})
+        self.assertIsNot(first, self.registry.client("s3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
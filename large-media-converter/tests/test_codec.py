@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import base64
+import json
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.codec import (
+    NoEventBodyException,
+    PayloadTooLargeException,
+    UnsupportedPayloadException,
+    decode_body,
+    encode_response,
+)
+from lambdas.src.models import APIResponse, Settings
+
+
+class TestCodec(unittest.TestCase):
+    """Test the API codec."""
+
+    def test_decode_body(self):
+        """Test decoding plain and base64 encoded JSON bodies."""
+        body = {"path": "test.mp4", "parts": [{"PartNumber": 1, "ETag": "ä"}]}
+        encoded = json.dumps(body)
+
+        self.assertEqual(decode_body({"body": encoded}), body)
+        self.assertEqual(
+            decode_body(
+                {
+                    "body": base64.b64encode(encoded.encode("utf-8")).decode(),
+                    "isBase64Encoded": True,
+                }
+            ),
+            body,
+        )
+
+        with self.subTest("Python literal bodies of legacy clients"):
+            self.assertEqual(
+                decode_body({"body": "{'path':'test.mp4'}"}), {"path": "test.mp4"}
+            )
+            with patch("lambdas.src.codec.bootstrap.settings") as settings:
+                settings.return_value = Settings(api_literal_bodies=False)
+                with self.assertRaises(UnsupportedPayloadException):
+                    decode_body({"body": "{'path':'test.mp4'}"})
+
+    def test_invalid_body(self):
+        """Test that invalid bodies are rejected as unsupported payloads."""
+        invalid = {
+            "no body": {},
+            "not an object": {"body": "[1, 2]"},
+            "not json": {"body": "{path: test.mp4}"},
+            "nan": {"body": '{"size": NaN}'},
+            "invalid base64": {"body": "{}", "isBase64Encoded": True},
+            "invalid utf-8": {
+                "body": base64.b64encode(b'{"path": "\\xff"}\xff').decode(),
+                "isBase64Encoded": True,
+            },
+        }
+        for name, event in invalid.items():
+            with self.subTest(name):
+                with self.assertRaises(UnsupportedPayloadException):
+                    decode_body(event)
+
+        with self.assertRaises(NoEventBodyException):
+            decode_body({})
+
+    def test_body_size_limit(self):
+        """Test that bodies above the size limit are rejected before decoding."""
+        body = json.dumps({"path": "x" * 100})
+
+        self.assertEqual(len(decode_body({"body": body}, max_bytes=len(body))), 1)
+        with self.assertRaises(PayloadTooLargeException):
+            decode_body({"body": body}, max_bytes=len(body) - 1)
+        with self.assertRaises(PayloadTooLargeException):
+            decode_body(
+                {
+                    "body": base64.b64encode(body.encode()).decode(),
+                    "isBase64Encoded": True,
+                },
+                max_bytes=50,
+            )
+
+    def test_encode_response(self):
+        """Test that responses match the APIResponse proxy shape."""
+        for body in ("message", {"parts": [1, 2]}, {"time": datetime(2024, 1, 1)}):
+            with self.subTest(body=body):
+                response = encode_response(body, status_code=201, headers={"a": "b"})
+                expected = APIResponse(statusCode=201, body=body, headers={"a": "b"})
+
+                self.assertEqual(response.keys(), expected.dict().keys())
+                self.assertEqual(
+                    json.loads(response["body"]), json.loads(expected.body)
+                )
+                self.assertEqual(response["statusCode"], 201)
+                self.assertFalse(response["isBase64Encoded"])
+
+
+if __name__ == "__main__":
+    unittest.main()
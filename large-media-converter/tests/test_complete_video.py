@@ -65,7 +65,7 @@ class TestCompleteVideo(unittest.TestCase):
     def test_handler_complete_status(self):
         """Test handler with complete status."""
 
-        with patch("lambdas.src.complete_video.boto3.client") as boto3_client:
+        with patch("lambdas.src.complete_video.clients.get_client") as boto3_client:
             boto3_client().get_job.return_value = get_mediaconvert_job()
 
             # Create test event
@@ -183,7 +183,7 @@ class TestCompleteVideo(unittest.TestCase):
                 ],
             },
         }
-        with patch("lambdas.src.complete_video.boto3.client") as boto3_client:
+        with patch("lambdas.src.complete_video.clients.get_client") as boto3_client:
             boto3_client().get_job.return_value = get_mediaconvert_job()
             handler(event, None)
 
@@ -249,7 +249,7 @@ class TestCompleteVideo(unittest.TestCase):
                 ],
             },
         }
-        with patch("lambdas.src.complete_video.boto3.client"):
+        with patch("lambdas.src.complete_video.clients.get_client"):
             handler(event, None)
 
     def test_handler_unkown_status(self):
@@ -314,7 +314,7 @@ class TestCompleteVideo(unittest.TestCase):
                 ],
             },
         }
-        with patch("lambdas.src.complete_video.boto3.client"):
+        with patch("lambdas.src.complete_video.clients.get_client"):
             with self.assertRaises(Exception):
                 handler(event, None)
 
@@ -366,9 +366,9 @@ class TestCompleteVideo(unittest.TestCase):
                 ],
             },
         }
-        with patch("lambdas.src.complete_video.boto3.client") as boto3_client, patch(
-            "lambdas.src.complete_video.utils"
-        ) as mock_utils:
+        with patch(
+            "lambdas.src.complete_video.clients.get_client"
+        ) as boto3_client, patch("lambdas.src.complete_video.utils") as mock_utils:
             boto3_client().get_job.return_value = get_mediaconvert_job()
             mock_utils.s3_url_to_bucket_and_key.return_value = (
                 "test-bucket",
@@ -380,7 +380,7 @@ class TestCompleteVideo(unittest.TestCase):
     def test_handler_missing_outputgroup_details(self):
         """Test handler with complete status."""
 
-        with patch("lambdas.src.complete_video.boto3.client") as boto3_client:
+        with patch("lambdas.src.complete_video.clients.get_client") as boto3_client:
             boto3_client().get_job.return_value = get_mediaconvert_job()
 
             # Create test event
@@ -13,12 +13,14 @@ from pathlib import Path
 
 import boto3
 import moto
+from botocore.exceptions import ClientError
 
 root_folder = Path(__file__).parent.parent.absolute()
 sys.path.insert(0, root_folder.as_posix())
 
 
-from lambdas.src.finalize import LambdaSettings, handler
+from lambdas.src import clients
+from lambdas.src.finalize import LambdaSettings, handler, status, worker
 
 
 def create_bucket(bucket_name):
@@ -97,7 +99,7 @@ class TestFinalize(unittest.TestCase):
 
         with self.subTest("General exception"):
             with unittest.mock.patch(
-                "lambdas.src.presign_urls.boto3.client"
+                "lambdas.src.finalize.clients.get_client"
             ) as mock_client:
                 mock_client().complete_multipart_upload.side_effect = Exception("Test")
                 event = {
@@ -112,6 +114,103 @@ class TestFinalize(unittest.TestCase):
                 with self.assertRaises(Exception):
                     resp = handler(event, None)
 
+    def test_async(self):
+        """Test asynchronous finalize with worker and status lookup."""
+        config_bucket = "dev-lmu-media-config-bucket"
+        os.environ["FINALIZE_BUCKET_NAME"] = config_bucket
+        os.environ["FINALIZE_WORKER_FUNCTION"] = "finalize-worker"
+        self.addCleanup(os.environ.pop, "FINALIZE_BUCKET_NAME")
+        self.addCleanup(os.environ.pop, "FINALIZE_WORKER_FUNCTION")
+
+        lambda_client = unittest.mock.MagicMock()
+        get_client = clients.get_client
+
+        def get_client_or_lambda(service, **kwargs):
+            if service == "lambda":
+                return lambda_client
+            return get_client(service, **kwargs)
+
+        def lookup(token):
+            resp = status({"body": json.dumps({"token": token})}, None)
+            return resp["statusCode"], json.loads(resp["body"])
+
+        with moto.mock_s3(), unittest.mock.patch(
+            "lambdas.src.finalize.clients.get_client", get_client_or_lambda
+        ):
+            create_bucket(self.bucket)
+            create_bucket(config_bucket)
+
+            s3 = boto3.client("s3")
+            upload = s3.create_multipart_upload(Bucket=self.bucket, Key="test.mov")
+            part = s3.upload_part(
+                Bucket=self.bucket,
+                Key="test.mov",
+                PartNumber=1,
+                UploadId=upload["UploadId"],
+                Body=b"test",
+            )
+            body = {
+                "path": "test.mov",
+                "file_id": upload["UploadId"],
+                "parts": [{"PartNumber": 1, "ETag": "wrong"}],
+                "mode": "async",
+            }
+
+            with self.subTest("Failed completion"):
+                resp = handler({"body": json.dumps(body)}, None)
+                self.assertEqual(resp["statusCode"], 202)
+                token = json.loads(resp["body"])["token"]
+                self.assertEqual(lookup(token)[1]["status"], "pending")
+
+                invoke = lambda_client.invoke.call_args.kwargs
+                self.assertEqual(invoke["FunctionName"], "finalize-worker")
+                self.assertEqual(invoke["InvocationType"], "Event")
+                worker(json.loads(invoke["Payload"]), None)
+
+                code, record = lookup(token)
+                self.assertEqual(code, 200)
+                self.assertEqual(record["status"], "failed")
+                self.assertIn("error", record)
+                self.assertNotIn("parts", record)
+
+            with self.subTest("Retried completion"):
+                lambda_client.reset_mock()
+                body["parts"] = [{"PartNumber": 1, "ETag": part["ETag"]}]
+                resp = handler({"body": json.dumps(body)}, None)
+                self.assertEqual(json.loads(resp["body"])["token"], token)
+
+                worker(
+                    json.loads(lambda_client.invoke.call_args.kwargs["Payload"]), None
+                )
+                self.assertEqual(lookup(token)[1]["status"], "completed")
+                s3.head_object(Bucket=self.bucket, Key="test.mov")
+
+            with self.subTest("Completed uploads are not started again"):
+                lambda_client.reset_mock()
+                resp = handler({"body": json.dumps(body)}, None)
+                self.assertEqual(json.loads(resp["body"])["status"], "completed")
+                lambda_client.invoke.assert_not_called()
+
+            with self.subTest("Duplicate worker invocation"):
+                s3.put_object(
+                    Bucket=config_bucket,
+                    Key=f"finalize/{token}.json",
+                    Body=json.dumps({**body, "status": "pending"}),
+                )
+                # moto raises a KeyError instead of NoSuchUpload
+                error = ClientError(
+                    {"Error": {"Code": "NoSuchUpload"}}, "CompleteMultipartUpload"
+                )
+                with unittest.mock.patch(
+                    "lambdas.src.finalize.complete_upload", side_effect=error
+                ):
+                    worker({"token": token}, None)
+                self.assertEqual(lookup(token)[1]["status"], "completed")
+
+            with self.subTest("Unknown and invalid tokens"):
+                self.assertEqual(lookup("0" * 32)[0], 404)
+                self.assertEqual(lookup("../x")[0], 400)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -89,7 +89,7 @@ class TestInitialize(unittest.TestCase):
 
         with self.subTest("General exception"):
             with unittest.mock.patch(
-                "lambdas.src.initialize.boto3.client"
+                "lambdas.src.initialize.clients.get_client"
             ) as mock_client:
                 mock_client().create_multipart_upload.side_effect = Exception("Test")
                 event = {"body": json.dumps({"path": "valid/path/valid.mp4"})}
@@ -112,6 +112,37 @@ class TestInitialize(unittest.TestCase):
             create_bucket(self.bucket)
             handler(event, None)
 
+    def test_planned_upload(self):
+        """Test the upload plan returned for a given file size."""
+        with self.subTest("Single PUT for small files"):
+            event = {"body": json.dumps({"path": "image.mp4", "size": 200 * 1024})}
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                resp = handler(event, None)
+                uploads = boto3.client("s3").list_multipart_uploads(Bucket=self.bucket)
+
+            body = json.loads(resp["body"])
+            self.assertEqual(resp["statusCode"], 200)
+            self.assertNotIn("file_id", body)
+            self.assertNotIn("Uploads", uploads)
+            self.assertFalse(body["plan"]["multipart"])
+            self.assertIn("image.mp4?", body["signedUrl"])
+
+        with self.subTest("Multipart upload for large files"):
+            event = {"body": json.dumps({"path": "video.mp4", "size": 10 * 1024**3})}
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                body = json.loads(handler(event, None)["body"])
+
+            self.assertIn("file_id", body)
+            self.assertTrue(body["plan"]["multipart"])
+            self.assertEqual(body["plan"]["parts"], 1280)
+            self.assertEqual(body["plan"]["concurrency"], 15)
+
+        with self.subTest("Test size validation"):
+            event = {"body": json.dumps({"path": "video.mp4", "size": -1})}
+            self.assertEqual(handler(event, None)["statusCode"], 400)
+
 
 if __name__ == "__main__":
     unittest.main()
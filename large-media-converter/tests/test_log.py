@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import json
+import logging
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.log import JsonFormatter, get_logger, payload, truncate
+from lambdas.src.models import Settings
+
+
+class ListHandler(logging.Handler):
+    """Collects the formatted records."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(JsonFormatter(max_chars=16, max_items=3))
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(self.format(record)))
+
+
+class TestLog(unittest.TestCase):
+    """Test the structured logging."""
+
+    def setUp(self):
+        self.logger = get_logger("lambdas.src.test")
+        self.handler = ListHandler()
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    def test_truncate(self):
+        """Test that long strings and collections are cut and credentials redacted."""
+        self.assertEqual(truncate("a" * 12, 10, 3), "aaaaaaaaaa...(+2 chars)")
+        self.assertEqual(truncate([1, 2, 3, 4], 10, 3), [1, 2, 3, "...(+1 items)"])
+        self.assertEqual(
+            truncate({"a": 1, "b": 2, "c": 3, "d": 4}, 10, 3),
+            {"a": 1, "b": 2, "c": 3, "...": "+1 keys"},
+        )
+        self.assertEqual(
+            truncate({"headers": {"Authorization": "Bearer x"}}, 10, 3),
+            {"headers": {"Authorization": "***"}},
+        )
+
+    def test_json_lines(self):
+        """Test that records are written as JSON with their fields."""
+        self.logger.info("Hello %s", "world", extra={"fields": {"path": "a" * 20}})
+
+        [line] = self.handler.lines
+        self.assertEqual(line["level"], "INFO")
+        self.assertEqual(line["logger"], "lmu.test")
+        self.assertEqual(line["message"], "Hello world")
+        self.assertEqual(line["path"], "a" * 16 + "...(+4 chars)")
+
+    def test_lazy_formatting(self):
+        """Test that arguments of disabled levels are never formatted."""
+
+        class Expensive:
+            def __str__(self):
+                raise AssertionError("formatted")
+
+        self.logger.debug("Value %s", Expensive())
+        self.assertEqual(self.handler.lines, [])
+
+    def test_payload_sampling(self):
+        """Test that payloads are dumped for the sample and summarized otherwise."""
+        event = {"body": "{}", "headers": {}}
+        with patch("lambdas.src.log.bootstrap.settings") as settings:
+            settings.return_value = Settings(log_payload_sample_rate=0)
+            payload(self.logger, "Request", event)
+            settings.return_value = Settings(log_payload_sample_rate=1)
+            payload(self.logger, "Request", event)
+
+        summary, dump = self.handler.lines
+        self.assertEqual(summary["payload_keys"], ["body", "headers"])
+        self.assertNotIn("payload", summary)
+        self.assertEqual(dump["payload"], event)
+
+    def test_payload_debug(self):
+        """Test that debug logging always dumps the payload."""
+        self.logger.setLevel(logging.DEBUG)
+        with patch("lambdas.src.log.bootstrap.settings") as settings:
+            settings.return_value = Settings(log_payload_sample_rate=0)
+            payload(self.logger, "Request", [1, 2])
+
+        self.assertEqual(self.handler.lines[0]["payload"], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.partlist import PartList
+
+
+class Request(BaseModel):
+    """Request with a part list."""
+
+    parts: PartList
+
+
+class TestPartList(unittest.TestCase):
+    """Test the compact part list."""
+
+    def test_parse(self):
+        """Test that parts are ordered by part number without sorting models."""
+        parts = [{"PartNumber": n, "ETag": f"etag-{n}"} for n in range(1, 10001)]
+        random.Random(0).shuffle(parts)
+
+        part_list = PartList.parse(parts)
+
+        self.assertEqual(len(part_list), 10000)
+        self.assertEqual(part_list.numbers.typecode, "H")
+        self.assertEqual(
+            part_list.to_boto3(),
+            sorted(parts, key=lambda part: part["PartNumber"]),
+        )
+
+    def test_extra_fields(self):
+        """Test that extra fields and numeric strings are accepted."""
+        part_list = PartList.parse(
+            [
+                {"PartNumber": "2", "ETag": "b", "Size": 5},
+                {"PartNumber": 1, "ETag": "a"},
+            ]
+        )
+        self.assertEqual(
+            part_list.to_boto3(),
+            [{"PartNumber": 1, "ETag": "a"}, {"PartNumber": 2, "ETag": "b"}],
+        )
+
+    def test_invalid(self):
+        """Test that invalid part lists are rejected as validation errors."""
+        invalid = {
+            "empty": [],
+            "not a list": {"PartNumber": 1, "ETag": "a"},
+            "missing etag": [{"PartNumber": 1}],
+            "empty etag": [{"PartNumber": 1, "ETag": ""}],
+            "not a part": ["a"],
+            "float part number": [{"PartNumber": 1.5, "ETag": "a"}],
+            "bool part number": [{"PartNumber": True, "ETag": "a"}],
+            "zero": [{"PartNumber": 0, "ETag": "a"}],
+            "gap": [{"PartNumber": 1, "ETag": "a"}, {"PartNumber": 3, "ETag": "c"}],
+            "duplicate": [
+                {"PartNumber": 1, "ETag": "a"},
+                {"PartNumber": 1, "ETag": "b"},
+            ],
+            "too many": [{"PartNumber": n, "ETag": "a"} for n in range(1, 10002)],
+        }
+        for name, parts in invalid.items():
+            with self.subTest(name):
+                with self.assertRaises(ValidationError):
+                    Request(parts=parts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import sys
+import unittest
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.planner import (
+    MAX_OBJECT_SIZE,
+    MAX_PARTS,
+    MIN_PART_SIZE,
+    GiB,
+    MiB,
+    plan_upload,
+)
+
+
+class TestPlanner(unittest.TestCase):
+    """Test the upload planner."""
+
+    def test_single_put(self):
+        """Test that small files are uploaded with a single PUT."""
+        for size in (0, 200 * 1024, 16 * MiB):
+            plan = plan_upload(size)
+            self.assertFalse(plan.multipart)
+            self.assertEqual((plan.parts, plan.concurrency), (1, 1))
+
+        self.assertFalse(plan_upload(4 * GiB, single_put_max_size=20 * GiB).multipart)
+        self.assertTrue(plan_upload(6 * GiB, single_put_max_size=20 * GiB).multipart)
+
+    def test_multipart(self):
+        """Test part size, count and concurrency of multipart uploads."""
+        plan = plan_upload(16 * MiB + 1)
+        self.assertTrue(plan.multipart)
+        self.assertEqual(
+            (plan.part_size, plan.parts, plan.concurrency), (8 * MiB, 3, 3)
+        )
+
+        plan = plan_upload(100 * MiB, part_size=MiB, single_put_max_size=0)
+        self.assertEqual(plan.part_size, MIN_PART_SIZE)
+        self.assertEqual(plan.parts, 20)
+        self.assertEqual(plan.concurrency, 15)
+
+    def test_part_limit(self):
+        """Test that part sizes grow to stay within 10,000 parts."""
+        for size in (100 * GiB, 1024 * GiB, MAX_OBJECT_SIZE):
+            plan = plan_upload(size)
+            self.assertLessEqual(plan.parts, MAX_PARTS)
+            self.assertGreaterEqual(plan.part_size * plan.parts, size)
+            self.assertEqual(plan.part_size % MiB, 0)
+
+        with self.assertRaises(ValueError):
+            plan_upload(MAX_OBJECT_SIZE + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
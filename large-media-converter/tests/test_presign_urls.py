@@ -5,6 +5,8 @@
 # For License information, see corresponding LICENSE file.
 """Automated tests for checking the modules."""
 
+import base64
+import gzip
 import json
 import os
 import sys
@@ -82,7 +84,7 @@ class TestPresignURLs(unittest.TestCase):
 
         with self.subTest("General exception"):
             with unittest.mock.patch(
-                "lambdas.src.presign_urls.boto3.client"
+                "lambdas.src.presign_urls.presigner.clients.get_client"
             ) as mock_client:
                 mock_client().generate_presigned_url.side_effect = Exception("Test")
                 event = {
@@ -93,6 +95,92 @@ class TestPresignURLs(unittest.TestCase):
                 with self.assertRaises(Exception):
                     resp = handler(event, None)
 
+    def test_compact_format(self):
+        """Test the compact response format with and without gzip."""
+        event = {
+            "body": json.dumps(
+                {
+                    "path": "test.mov",
+                    "file_id": "test",
+                    "parts": 100,
+                    "format": "compact",
+                }
+            ),
+        }
+
+        with moto.mock_s3():
+            create_bucket(self.bucket)
+            resp = handler(dict(event), None)
+
+        self.assertEqual(resp["statusCode"], 200)
+        self.assertFalse(resp["isBase64Encoded"])
+        body = json.loads(resp["body"])
+        self.assertEqual(body["format"], "compact")
+        self.assertEqual(body["firstPart"], 1)
+        self.assertEqual(len(body["signatures"]), 100)
+
+        url = body["template"].format(PartNumber=100, signature=body["signatures"][-1])
+        self.assertIn("test.mov?", url)
+        self.assertIn("partNumber=100&", url)
+        self.assertTrue(url.endswith(body["signatures"][-1]))
+
+        with self.subTest("Gzip compressed body"):
+            event["headers"] = {"accept-encoding": "gzip, deflate, br"}
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                resp = handler(dict(event), None)
+
+            self.assertTrue(resp["isBase64Encoded"])
+            self.assertEqual(resp["headers"]["Content-Encoding"], "gzip")
+            body = json.loads(gzip.decompress(base64.b64decode(resp["body"])))
+            self.assertEqual(len(body["signatures"]), 100)
+
+        with self.subTest("Invalid format"):
+            event = {
+                "body": json.dumps(
+                    {"path": "test.mov", "file_id": "test", "parts": 2, "format": "x"}
+                )
+            }
+            resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 400)
+
+    def test_windowed(self):
+        """Test fetching part URLs in windows with a cursor."""
+        os.environ["MAX_PARTS_PER_REQUEST"] = "40"
+        self.addCleanup(os.environ.pop, "MAX_PARTS_PER_REQUEST")
+
+        def request(**kwargs):
+            payload = {"path": "test.mov", "file_id": "test", "parts": 100, **kwargs}
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                return handler({"body": json.dumps(payload)}, None)
+
+        with self.subTest("Server bounds the window"):
+            body = json.loads(request()["body"])
+            self.assertEqual(
+                [p["PartNumber"] for p in body["parts"]], list(range(1, 41))
+            )
+            self.assertEqual(body["nextPart"], 41)
+
+        with self.subTest("Client window and cursor"):
+            body = json.loads(request(start_part=41, max_parts=10)["body"])
+            self.assertEqual(
+                [p["PartNumber"] for p in body["parts"]], list(range(41, 51))
+            )
+            self.assertEqual(body["nextPart"], 51)
+
+        with self.subTest("Last window"):
+            body = json.loads(request(start_part=81, format="compact")["body"])
+            self.assertEqual(body["firstPart"], 81)
+            self.assertEqual(len(body["signatures"]), 20)
+            self.assertIsNone(body["nextPart"])
+
+        with self.subTest("Invalid windows"):
+            self.assertEqual(request(start_part=101)["statusCode"], 400)
+            self.assertEqual(request(start_part=0)["statusCode"], 400)
+            self.assertEqual(request(max_parts=0)["statusCode"], 400)
+            self.assertEqual(request(parts=10001)["statusCode"], 400)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,7 @@ sys.path.insert(0, root_folder.as_posix())
 
 
 from lambdas.src import utils
+from lambdas.src.batch import BatchRecordException
 from lambdas.src.process_audio import LambdaSettings, handler
 
 env = os.environ
@@ -135,6 +136,94 @@ class TestProcessAudio(unittest.TestCase):
             )
             self.assertEqual(msg.subject, "COMPLETE")
 
+    def test_handler_batch(self):
+        with moto.mock_s3(), moto.mock_sns(), patch(
+            "lambdas.src.mediainfo.utils.send_sns"
+        ) as send_sns, patch("lambdas.src.mediainfo.utils.send_exception"):
+            create_bucket(env["DESTINATION_BUCKET"])
+            create_bucket(env["SRC_BUCKET"])
+            keys = [f"test/example-{i}.mp3" for i in range(6)]
+            for key in keys[:4]:
+                upload_file(env["SRC_BUCKET"], key, self.file)
+
+            records = [
+                {
+                    "awsRegion": "eu-west-1",
+                    "s3": {
+                        "bucket": {"name": env["SRC_BUCKET"]},
+                        "object": {"key": key},
+                    },
+                }
+                for key in keys
+            ]
+            event = utils.convert_s3_event_to_sns_event({"Records": records})
+
+            with self.assertRaisesRegex(BatchRecordException, "2 of 6 records"):
+                handler(event, None)
+
+            for key in keys[:4]:
+                self.assertTrue(check_file_exists(env["DESTINATION_BUCKET"], key))
+            self.assertEqual(send_sns.call_count, 4)
+
+    def test_handler_sqs(self):
+        """Test that SQS batches only report the messages of failed objects."""
+        with moto.mock_sns(), moto.mock_sqs(), patch(
+            "lambdas.src.process_audio.process_record"
+        ) as process_record:
+            sns = boto3.client("sns", "eu-west-1")
+            sqs = boto3.client("sqs", "eu-west-1")
+            topic = create_sns_topic("dev-lmu-large-media-upload-event")
+            queue_url = sqs.create_queue(QueueName="dev-lmu-process_audio")["QueueUrl"]
+            queue_arn = sqs.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=["QueueArn"]
+            )["Attributes"]["QueueArn"]
+            sns.subscribe(TopicArn=topic, Protocol="sqs", Endpoint=queue_arn)
+
+            keys = [f"test/example-{i}.mp3" for i in range(2000)]
+            for start in range(0, len(keys), 10):
+                entries = [
+                    {
+                        "Id": str(i),
+                        "Message": json.dumps(
+                            {"Records": [{"s3": {"object": {"key": key}}}]}
+                        ),
+                    }
+                    for i, key in enumerate(keys[start : start + 10])
+                ]
+                sns.publish_batch(TopicArn=topic, PublishBatchRequestEntries=entries)
+
+            def fail_every_hundredth(lst, context, event):
+                if event["Records"][0]["s3"]["object"]["key"].endswith("7.mp3"):
+                    raise Exception("Test")
+
+            process_record.side_effect = fail_every_hundredth
+
+            received, failed = 0, []
+            while True:
+                messages = sqs.receive_message(
+                    QueueUrl=queue_url, MaxNumberOfMessages=10
+                ).get("Messages", [])
+                if not messages:
+                    break
+                records = [
+                    {
+                        "messageId": message["MessageId"],
+                        "receiptHandle": message["ReceiptHandle"],
+                        "body": message["Body"],
+                        "eventSource": "aws:sqs",
+                    }
+                    for message in messages
+                ]
+                response = handler({"Records": records}, None)
+                failed.extend(
+                    item["itemIdentifier"] for item in response["batchItemFailures"]
+                )
+                received += len(messages)
+
+            self.assertEqual(received, 2000)
+            self.assertEqual(process_record.call_count, 2000)
+            self.assertEqual(len(failed), 200)
+
     def test_handler_ignore_unsupported_file(self):
         event = dict(self.s3_event)
         event["Records"][0]["s3"]["object"]["key"] = "example.txt"
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+
+import boto3
+import moto
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.resume import LambdaSettings, handler, missing_ranges
+
+
+def create_bucket(bucket_name):
+    """Create a bucket."""
+    s3 = boto3.client("s3", "eu-west-1")
+    s3.create_bucket(
+        Bucket=bucket_name,
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+
+
+def create_upload(bucket_name, key, part_numbers):
+    """Create a multipart upload with the given parts uploaded."""
+    s3 = boto3.client("s3", "eu-west-1")
+    upload_id = s3.create_multipart_upload(Bucket=bucket_name, Key=key)["UploadId"]
+    for part_number in part_numbers:
+        s3.upload_part(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=b"x",
+        )
+    return upload_id
+
+
+class TestResume(unittest.TestCase):
+    """Test the lambda."""
+
+    def setUp(self):
+        self.bucket = "dev-lmu-media-input-bucket"
+        os.environ["BUCKET_NAME"] = self.bucket
+        os.environ["INPUT_FILE_SUFFIXES"] = json.dumps([".mp4", ".mov", ".avi", ".mkv"])
+        os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
+
+    def test_lambda_settings(self):
+        """Test LambdaSettings for correct configuration."""
+        settings = LambdaSettings()
+        self.assertIsNotNone(settings.bucket_name)
+        self.assertIsInstance(settings.input_file_suffixes, list)
+
+    def test_missing_ranges(self):
+        """Test the ranges of parts not uploaded yet."""
+        self.assertEqual(missing_ranges([], 5), [[1, 5]])
+        self.assertEqual(missing_ranges([1, 2, 3, 4, 5], 5), [])
+        self.assertEqual(missing_ranges([4, 2], 5), [[1, 1], [3, 3], [5, 5]])
+        self.assertEqual(missing_ranges([1, 5, 7], 5), [[2, 4]])
+
+    def test_request(self):
+        """Test listing the parts of an upload over several pages."""
+        # moto pages by list index instead of part number, so gaps are only
+        # placed on the last page
+        uploaded = list(range(1, 2001)) + [n for n in range(2001, 2501) if n % 7]
+
+        with moto.mock_s3():
+            create_bucket(self.bucket)
+            upload_id = create_upload(self.bucket, "test.mov", uploaded)
+            event = {
+                "body": json.dumps(
+                    {"path": "test.mov", "file_id": upload_id, "parts": 10000}
+                )
+            }
+            resp = handler(event, None)
+
+        self.assertEqual(resp["statusCode"], 200)
+        self.assertIn("Access-Control-Allow-Origin", resp["headers"])
+        body = json.loads(resp["body"])
+        self.assertEqual([part["PartNumber"] for part in body["parts"]], uploaded)
+        self.assertNotIn('"', body["parts"][0]["ETag"])
+        self.assertEqual(body["missing"][:2], [[2002, 2002], [2009, 2009]])
+        self.assertEqual(body["missing"][-1], [2501, 10000])
+
+        with self.subTest("Without part count"):
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                upload_id = create_upload(self.bucket, "test.mov", [2])
+                event = {"body": json.dumps({"path": "test.mov", "file_id": upload_id})}
+                body = json.loads(handler(event, None)["body"])
+            self.assertEqual(len(body["parts"]), 1)
+            self.assertNotIn("missing", body)
+
+        with self.subTest("Unknown upload"):
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                event = {"body": json.dumps({"path": "test.mov", "file_id": "test"})}
+                resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 404)
+
+        with self.subTest("Test path validation with wrong file"):
+            event = {"body": json.dumps({"path": "test.txt", "file_id": "test"})}
+            resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
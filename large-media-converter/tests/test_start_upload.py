@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Author: Oliver Borchers <o.borchers@oxolo.com>
+# For License information, see corresponding LICENSE file.
+"""Automated tests for checking the modules."""
+
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+
+import boto3
+import moto
+
+root_folder = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, root_folder.as_posix())
+
+
+from lambdas.src.start_upload import LambdaSettings, handler
+
+
+def create_bucket(bucket_name):
+    """Create a bucket."""
+    s3 = boto3.client("s3", "eu-west-1")
+    s3.create_bucket(
+        Bucket=bucket_name,
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+    )
+
+
+class TestStartUpload(unittest.TestCase):
+    """Test the lambda."""
+
+    def setUp(self):
+        self.bucket = "dev-lmu-media-input-bucket"
+        os.environ["BUCKET_NAME"] = self.bucket
+        os.environ["INPUT_FILE_SUFFIXES"] = json.dumps([".mp4", ".mov", ".avi", ".mkv"])
+        os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
+
+    def test_lambda_settings(self):
+        """Test LambdaSettings for correct configuration."""
+        settings = LambdaSettings()
+        self.assertIsNotNone(settings.bucket_name)
+        self.assertIsInstance(settings.input_file_suffixes, list)
+        self.assertEqual(settings.url_expires, 3600)
+
+    def test_request(self):
+        """Test that the upload is created and the first window presigned."""
+        event = {
+            "body": json.dumps(
+                {"path": "valid/path/valid.mp4", "parts": 30, "max_parts": 10}
+            )
+        }
+
+        with moto.mock_s3():
+            create_bucket(self.bucket)
+            resp = handler(event, None)
+            body = json.loads(resp["body"])
+            uploads = boto3.client("s3").list_multipart_uploads(Bucket=self.bucket)
+
+        self.assertEqual(resp["statusCode"], 200)
+        self.assertIn("Access-Control-Allow-Origin", resp["headers"])
+        self.assertEqual(body["path"], "valid/path/valid.mp4")
+        self.assertEqual(body["file_id"], uploads["Uploads"][0]["UploadId"])
+        self.assertEqual([p["PartNumber"] for p in body["parts"]], list(range(1, 11)))
+        self.assertIn(body["file_id"], body["parts"][0]["signedUrl"])
+        self.assertEqual(body["nextPart"], 11)
+
+        with self.subTest("Compact format"):
+            event = {
+                "body": json.dumps(
+                    {"path": "valid.mov", "parts": 5, "format": "compact"}
+                )
+            }
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                body = json.loads(handler(event, None)["body"])
+            self.assertEqual(len(body["signatures"]), 5)
+            self.assertIsNone(body["nextPart"])
+
+        with self.subTest("Test path validation with wrong file"):
+            event = {"body": json.dumps({"path": "test.txt", "parts": 2})}
+            resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 400)
+
+        with self.subTest("Test validation without parts or size"):
+            event = {"body": json.dumps({"path": "valid.mp4"})}
+            resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 400)
+
+        with self.subTest("Test validation with parts and size"):
+            event = {"body": json.dumps({"path": "valid.mp4", "parts": 2, "size": 1})}
+            resp = handler(event, None)
+            self.assertEqual(resp["statusCode"], 400)
+
+        with self.subTest("General exception"):
+            with unittest.mock.patch(
+                "lambdas.src.start_upload.initialize.clients.get_client"
+            ) as mock_client:
+                mock_client().create_multipart_upload.side_effect = Exception("Test")
+                event = {"body": json.dumps({"path": "valid.mp4", "parts": 2})}
+                with self.assertRaises(Exception):
+                    handler(event, None)
+
+    def test_planned_upload(self):
+        """Test that the parts of the first window follow the upload plan."""
+        with self.subTest("Multipart upload"):
+            event = {
+                "body": json.dumps(
+                    {"path": "video.mp4", "size": 100 * 1024**2, "max_parts": 5}
+                )
+            }
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                body = json.loads(handler(event, None)["body"])
+
+            self.assertEqual(body["plan"]["parts"], 13)
+            self.assertEqual(len(body["parts"]), 5)
+            self.assertEqual(body["nextPart"], 6)
+
+        with self.subTest("Single PUT"):
+            event = {"body": json.dumps({"path": "video.mp4", "size": 1024})}
+            with moto.mock_s3():
+                create_bucket(self.bucket)
+                body = json.loads(handler(event, None)["body"])
+
+            self.assertFalse(body["plan"]["multipart"])
+            self.assertIn("signedUrl", body)
+            self.assertNotIn("parts", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -206,11 +206,11 @@ class TestSubmitVideo(unittest.TestCase):
     def test_submit_job(self):
         """Tests the submit_job function."""
         job = Job.parse_obj(self.config)
-        with unittest.mock.patch("lambdas.src.submit_video.boto3.client"):
+        with unittest.mock.patch("lambdas.src.submit_video.clients.get_client"):
             submit_job(job, "1234")
 
         with unittest.mock.patch(
-            "lambdas.src.submit_video.boto3.client"
+            "lambdas.src.submit_video.clients.get_client"
         ) as mock_client:
             mock_client().create_job.side_effect = Exception("Test")
             with self.assertRaises(Exception):
@@ -5,6 +5,8 @@
 # For License information, see corresponding LICENSE file.
 """Automated tests for checking the modules."""
 
+import base64
+import gzip
 import json
 import os
 import sys
@@ -52,7 +54,9 @@ class TestUtils(unittest.TestCase):
             utils.send_sns(resp["TopicArn"], message)
 
         with self.subTest("General Exception"):
-            with unittest.mock.patch("boto3.client") as mock_client:
+            with unittest.mock.patch(
+                "lambdas.src.utils.clients.get_client"
+            ) as mock_client:
                 mock_client().publish.side_effect = Exception("Test")
                 with self.assertRaises(Exception):
                     utils.send_sns(resp["TopicArn"], message)
@@ -75,7 +79,9 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(result, {"key": "value"})
 
         with self.subTest("General Exception"):
-            with unittest.mock.patch("boto3.client") as mock_client:
+            with unittest.mock.patch(
+                "lambdas.src.utils.clients.get_client"
+            ) as mock_client:
                 mock_client().get_object.side_effect = Exception("Test")
                 with self.assertRaises(Exception):
                     result = utils.get_json_from_s3(bucket_name, key)
@@ -103,6 +109,25 @@ class TestUtils(unittest.TestCase):
         event = {"isBase64Encoded": True, "body": "eyJIZWxsbyI6ICJ3b3JsZCJ9"}
         utils.preprocess_api_event(event)
 
+    def test_gzip_api_response(self):
+        """Test that the body is only compressed if the client accepts gzip."""
+        response = models.APIResponse(body={"parts": ["x" * 2048]}).dict()
+
+        resp = utils.gzip_api_response(response, {"Accept-Encoding": "gzip, br"})
+        self.assertTrue(resp["isBase64Encoded"])
+        self.assertEqual(resp["headers"]["Content-Encoding"], "gzip")
+        body = gzip.decompress(base64.b64decode(resp["body"])).decode("utf-8")
+        self.assertEqual(body, response["body"])
+
+        self.assertEqual(utils.gzip_api_response(response, {}), response)
+        self.assertEqual(utils.gzip_api_response(response, None), response)
+        self.assertEqual(
+            utils.gzip_api_response(
+                response, {"accept-encoding": "gzip"}, min_size=10**6
+            ),
+            response,
+        )
+
     def test_retrive_sources_from_s3(self):
         """Test the retrive_sources_from_s3 function."""
         event = {
@@ -114,6 +114,12 @@ variable "video_max_height" {
   default     = 1800
 }
 
+variable "record_concurrency" {
+  type        = number
+  description = "Max records of a batched event processed in parallel by the media lambdas"
+  default     = 8
+}
+
 variable "video_sharpness" {
   type        = number
   description = "Sharpness for video"